@@ -5,6 +5,7 @@ from __future__ import print_function
 __author__ = "bibow"
 
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from graphene import Schema
@@ -201,6 +202,10 @@ def deploy() -> List:
                             "action": "insertUpdateQuoteItem",
                             "label": "Create Update Quote Item",
                         },
+                        {
+                            "action": "batchInsertQuoteItems",
+                            "label": "Batch Create Quote Items",
+                        },
                         {
                             "action": "deleteQuoteItem",
                             "label": "Delete Quote Item",
@@ -247,6 +252,25 @@ class AIRFQEngine(Graphql):
             BaseModel.Meta.aws_access_key_id = setting.get("aws_access_key_id")
             BaseModel.Meta.aws_secret_access_key = setting.get("aws_secret_access_key")
 
+        # Every model's Meta inherits from BaseModel.Meta, but PynamoDB reads
+        # these settings only when it first creates a model's connection, so
+        # the engine must be built before any model is used. Values often
+        # arrive as strings from env/config, so they are coerced (or rejected)
+        # here rather than failing inside botocore on the first DynamoDB call.
+        for key, cast in (
+            ("max_pool_connections", int),
+            ("connect_timeout_seconds", float),
+            ("read_timeout_seconds", float),
+            ("max_retry_attempts", int),
+        ):
+            if setting.get(key) is not None:
+                try:
+                    setattr(BaseModel.Meta, key, cast(setting[key]))
+                except (TypeError, ValueError) as exc:
+                    raise ValueError(
+                        f"{key} must be {cast.__name__}, got: {setting[key]!r}"
+                    ) from exc
+
         # Initialize configuration via the Config class
         Config.initialize(logger, **setting)
 
@@ -293,15 +317,17 @@ class AIRFQEngine(Graphql):
 
         self._apply_partition_defaults(params)
 
-        schema = Schema(
-            query=Query,
-            mutation=Mutations,
-            types=type_class(),
-        )
-        return self.execute(schema, **params)
+        return self.execute(self.build_graphql_schema(), **params)
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def build_graphql_schema() -> Schema:
+        """
+        Build the GraphQL schema once per process.
+
+        The schema is static, so converting the graphene types into the
+        graphql-core schema is done on first use and reused afterwards.
+        """
         return Schema(
             query=Query,
             mutation=Mutations,
@@ -5,7 +5,6 @@ from __future__ import print_function
 __author__ = "bibow"
 
 import functools
-import traceback
 from typing import Any, Dict
 
 import pendulum
@@ -229,10 +228,11 @@ def purge_cache():
                 )
 
                 return result
-            except Exception as e:
-                log = traceback.format_exc()
-                args[0].context.get("logger").error(log)
-                raise e
+            except Exception:
+                args[0].context.get("logger").exception(
+                    f"{original_function.__name__} failed."
+                )
+                raise
 
         return wrapper_function
 
@@ -5,7 +5,6 @@ from __future__ import print_function
 __author__ = "bibow"
 
 import functools
-import traceback
 from typing import Any, Dict
 
 import pendulum
@@ -27,45 +26,6 @@ from ..types.item_price_tier import ItemPriceTierListType, ItemPriceTierType
 from ..utils.normalization import normalize_to_json
 
 
-def _get_provider_item(partition_key: str, provider_item_uuid: str) -> Dict[str, Any]:
-    """Helper to get provider_item data for eager loading."""
-    from .provider_item import get_provider_item, get_provider_item_count
-
-    count = get_provider_item_count(partition_key, provider_item_uuid)
-    if count == 0:
-        return {}
-
-    provider_item = get_provider_item(partition_key, provider_item_uuid)
-    return {
-        "partition_key": provider_item.partition_key,
-        "provider_item_uuid": provider_item.provider_item_uuid,
-        "provider_corp_external_id": provider_item.provider_corp_external_id,
-        "provider_item_external_id": getattr(
-            provider_item, "provider_item_external_id", None
-        ),
-        "base_price_per_uom": provider_item.base_price_per_uom,
-        "item_uuid": provider_item.item_uuid,
-    }
-
-
-def _get_segment(partition_key: str, segment_uuid: str) -> Dict[str, Any]:
-    """Helper to get segment data for eager loading."""
-    from .segment import get_segment, get_segment_count
-
-    count = get_segment_count(partition_key, segment_uuid)
-    if count == 0:
-        return {}
-
-    segment = get_segment(partition_key, segment_uuid)
-    return {
-        "partition_key": segment.partition_key,
-        "segment_uuid": segment.segment_uuid,
-        "provider_corp_external_id": segment.provider_corp_external_id,
-        "segment_name": segment.segment_name,
-        "segment_description": segment.segment_description,
-    }
-
-
 class ProviderItemUuidIndex(LocalSecondaryIndex):
     """
     This class represents a local secondary index
@@ -205,10 +165,11 @@ def purge_cache():
                     )
 
                 return result
-            except Exception as e:
-                log = traceback.format_exc()
-                args[0].context.get("logger").error(log)
-                raise e
+            except Exception:
+                args[0].context.get("logger").exception(
+                    f"{original_function.__name__} failed."
+                )
+                raise
 
         return wrapper_function
 
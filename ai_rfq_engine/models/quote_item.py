@@ -5,8 +5,8 @@ from __future__ import print_function
 __author__ = "bibow"
 
 import functools
-import traceback
-from typing import Any, Dict
+import uuid
+from typing import Any, Dict, List
 
 import pendulum
 from graphene import ResolveInfo
@@ -257,10 +257,11 @@ def purge_cache():
                     )
 
                 return result
-            except Exception as e:
-                log = traceback.format_exc()
-                args[0].context.get("logger").error(log)
-                raise e
+            except Exception:
+                args[0].context.get("logger").exception(
+                    f"{original_function.__name__} failed."
+                )
+                raise
 
         return wrapper_function
 
@@ -424,6 +425,97 @@ def resolve_quote_item_list(info: ResolveInfo, **kwargs: Dict[str, Any]) -> Any:
     return inquiry_funct, count_funct, args
 
 
+def _build_new_quote_item_cols(
+    info: ResolveInfo,
+    request_uuid: str,
+    updated_by: str,
+    data: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Validate a new quote item and return its attributes with tier pricing,
+    subtotal and final_subtotal filled in.
+    """
+    cols = {
+        "partition_key": info.context.get("partition_key"),
+        "updated_by": updated_by,
+        "created_at": pendulum.now("UTC"),
+        "updated_at": pendulum.now("UTC"),
+    }
+
+    # Get required fields for tier pricing
+    item_uuid = data.get("item_uuid")
+    qty = data.get("qty")
+    segment_uuid = data.get("segment_uuid")  # Required for tier pricing
+    provider_item_uuid = data.get("provider_item_uuid")  # Required for tier pricing
+    batch_no = data.get("batch_no")  # Optional for specific batch selection
+
+    # Validate required fields
+    if not (item_uuid and qty and segment_uuid and provider_item_uuid):
+        raise ValueError(
+            "item_uuid, qty, segment_uuid, and provider_item_uuid are required for tier pricing"
+        )
+
+    # Validate qty is positive
+    if float(qty) <= 0:
+        raise ValueError(f"qty must be greater than 0, got: {qty}")
+
+    # Calculate price_per_uom from tier pricing
+    price_per_uom = get_price_per_uom(
+        info, item_uuid, qty, segment_uuid, provider_item_uuid, batch_no
+    )
+
+    if price_per_uom is None:
+        raise ValueError(
+            f"No price tier found for item_uuid={item_uuid}, qty={qty}, "
+            f"segment_uuid={segment_uuid}, provider_item_uuid={provider_item_uuid}"
+        )
+
+    # Set all required fields
+    cols["item_uuid"] = item_uuid
+    cols["provider_item_uuid"] = provider_item_uuid
+    cols["qty"] = qty
+    cols["request_uuid"] = request_uuid
+    cols["price_per_uom"] = price_per_uom
+
+    # Set optional fields
+    if batch_no:
+        cols["batch_no"] = batch_no
+    if "request_data" in data:
+        cols["request_data"] = data["request_data"]
+    if "subtotal_discount" in data:
+        cols["subtotal_discount"] = data["subtotal_discount"]
+    if "notes" in data:
+        cols["notes"] = data["notes"]
+
+    # Auto-calculate subtotal and final_subtotal
+    cols["subtotal"] = float(cols["price_per_uom"]) * float(cols["qty"])
+    subtotal_discount = cols.get("subtotal_discount", 0)
+    cols["final_subtotal"] = cols["subtotal"] - subtotal_discount
+
+    return cols
+
+
+def _coerce_batch_quote_item(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Coerce a raw JSONCamelCase batch item to the types the typed
+    insertUpdateQuoteItem arguments would have produced.
+    """
+    item = dict(data)
+    for key in ("qty", "subtotal_discount"):
+        if item.get(key) is not None:
+            try:
+                item[key] = float(item[key])
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"{key} must be a number, got: {item[key]!r}") from exc
+    if item.get("request_data") is not None and not isinstance(
+        item["request_data"], dict
+    ):
+        raise ValueError(
+            f"request_data must be an object, got: {item['request_data']!r}"
+        )
+    return item
+
+
 @insert_update_decorator(
     keys={
         "hash_key": "quote_uuid",
@@ -444,65 +536,10 @@ def insert_update_quote_item(info: ResolveInfo, **kwargs: Dict[str, Any]) -> Non
         raise ValueError("request_uuid is required when creating a new quote item")
 
     if kwargs.get("entity") is None:
-        cols = {
-            "partition_key": info.context.get("partition_key"),
-            "updated_by": kwargs["updated_by"],
-            "created_at": pendulum.now("UTC"),
-            "updated_at": pendulum.now("UTC"),
-        }
-
-        # Get required fields for tier pricing
-        item_uuid = kwargs.get("item_uuid")
-        qty = kwargs.get("qty")
-        segment_uuid = kwargs.get("segment_uuid")  # Required for tier pricing
-        provider_item_uuid = kwargs.get(
-            "provider_item_uuid"
-        )  # Required for tier pricing
-        batch_no = kwargs.get("batch_no")  # Optional for specific batch selection
-
-        # Validate required fields
-        if not (item_uuid and qty and segment_uuid and provider_item_uuid):
-            raise ValueError(
-                "item_uuid, qty, segment_uuid, and provider_item_uuid are required for tier pricing"
-            )
-
-        # Validate qty is positive
-        if float(qty) <= 0:
-            raise ValueError(f"qty must be greater than 0, got: {qty}")
-
-        # Calculate price_per_uom from tier pricing
-        price_per_uom = get_price_per_uom(
-            info, item_uuid, qty, segment_uuid, provider_item_uuid, batch_no
+        cols = _build_new_quote_item_cols(
+            info, request_uuid, kwargs["updated_by"], kwargs
         )
 
-        if price_per_uom is None:
-            raise ValueError(
-                f"No price tier found for item_uuid={item_uuid}, qty={qty}, "
-                f"segment_uuid={segment_uuid}, provider_item_uuid={provider_item_uuid}"
-            )
-
-        # Set all required fields
-        cols["item_uuid"] = item_uuid
-        cols["provider_item_uuid"] = provider_item_uuid
-        cols["qty"] = qty
-        cols["request_uuid"] = request_uuid
-        cols["price_per_uom"] = price_per_uom
-
-        # Set optional fields
-        if batch_no:
-            cols["batch_no"] = batch_no
-        if "request_data" in kwargs:
-            cols["request_data"] = kwargs["request_data"]
-        if "subtotal_discount" in kwargs:
-            cols["subtotal_discount"] = kwargs["subtotal_discount"]
-        if "notes" in kwargs:
-            cols["notes"] = kwargs["notes"]
-
-        # Auto-calculate subtotal and final_subtotal
-        cols["subtotal"] = float(cols["price_per_uom"]) * float(cols["qty"])
-        subtotal_discount = cols.get("subtotal_discount", 0)
-        cols["final_subtotal"] = cols["subtotal"] - subtotal_discount
-
         QuoteItemModel(
             quote_uuid,
             quote_item_uuid,
@@ -559,6 +596,65 @@ def insert_update_quote_item(info: ResolveInfo, **kwargs: Dict[str, Any]) -> Non
     return
 
 
+@purge_cache()
+def insert_quote_items(
+    info: ResolveInfo, **kwargs: Dict[str, Any]
+) -> List[QuoteItemType]:
+    """
+    Insert several new quote items for one quote.
+
+    The quote is looked up and every item is priced and validated before
+    anything is written, so a missing quote or an invalid item leaves the
+    table untouched. The items are then saved with one BatchWriteItem per 25
+    items and the quote totals are recalculated once instead of once per item.
+
+    BatchWriteItem is not atomic: if a later chunk fails, the earlier chunks
+    stay written. The quote totals are recalculated in that case too, so they
+    always match the items that were saved before the error is re-raised.
+    """
+    from .quote import get_quote_count, update_quote_totals
+
+    quote_uuid = kwargs["quote_uuid"]
+    request_uuid = kwargs["request_uuid"]
+
+    if not kwargs.get("items"):
+        raise ValueError("items must contain at least one quote item")
+
+    if get_quote_count(request_uuid, quote_uuid) == 0:
+        raise ValueError(
+            f"Quote not found: request_uuid={request_uuid}, quote_uuid={quote_uuid}"
+        )
+
+    # Coerce every item before pricing any of them so a malformed field fails
+    # the whole batch up front.
+    items = [_coerce_batch_quote_item(item) for item in kwargs["items"]]
+
+    quote_items = [
+        QuoteItemModel(
+            quote_uuid,
+            str(uuid.uuid1().int >> 64),
+            **convert_decimal_to_number(
+                _build_new_quote_item_cols(
+                    info, request_uuid, kwargs["updated_by"], item
+                )
+            ),
+        )
+        for item in items
+    ]
+
+    # BatchWriteItem accepts no condition expressions. Each item gets a fresh
+    # uuid1-derived quote_item_uuid above, so the puts cannot overwrite an
+    # existing row, which is what a per-item attribute_not_exists would guard.
+    try:
+        with QuoteItemModel.batch_write() as batch:
+            for quote_item in quote_items:
+                batch.save(quote_item)
+    finally:
+        update_quote_totals(info, request_uuid, quote_uuid)
+
+    return [get_quote_item_type(info, quote_item) for quote_item in quote_items]
+
+
 @delete_decorator(
     keys={
         "hash_key": "quote_uuid",
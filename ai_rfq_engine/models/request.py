@@ -5,7 +5,6 @@ from __future__ import print_function
 __author__ = "bibow"
 
 import functools
-import traceback
 from typing import Any, Dict
 
 import pendulum
@@ -130,10 +129,11 @@ def purge_cache():
                 )
 
                 return result
-            except Exception as e:
-                log = traceback.format_exc()
-                args[0].context.get("logger").error(log)
-                raise e
+            except Exception:
+                args[0].context.get("logger").exception(
+                    f"{original_function.__name__} failed."
+                )
+                raise
 
         return wrapper_function
 
@@ -253,13 +253,20 @@ def _validate_request_items(partition_key: str, items: list) -> None:
     if not items:
         return
 
+    # Keys already confirmed to exist; items commonly share the same
+    # item/provider item, so each parent is only looked up once.
+    validated = set()
+
     for idx, item in enumerate(items):
         # Validate item_uuid if provided
         if "item_uuid" in item and item["item_uuid"]:
-            if not validate_item_exists(partition_key, item["item_uuid"]):
-                raise ValueError(
-                    f"Item at index {idx}: item_uuid '{item['item_uuid']}' does not exist"
-                )
+            key = ("item", item["item_uuid"])
+            if key not in validated:
+                if not validate_item_exists(partition_key, item["item_uuid"]):
+                    raise ValueError(
+                        f"Item at index {idx}: item_uuid '{item['item_uuid']}' does not exist"
+                    )
+                validated.add(key)
 
         # Validate provider_items if provided (new format)
         if "provider_items" in item and item["provider_items"]:
@@ -269,16 +276,26 @@ def _validate_request_items(partition_key: str, items: list) -> None:
                     "provider_item_uuid" in provider_item
                     and provider_item["provider_item_uuid"]
                 ):
-                    if not validate_provider_item_exists(
-                        partition_key, provider_item["provider_item_uuid"]
-                    ):
-                        raise ValueError(
-                            f"Item at index {idx}, provider_item at index {provider_idx}: "
-                            f"provider_item_uuid '{provider_item['provider_item_uuid']}' does not exist"
-                        )
+                    key = ("provider_item", provider_item["provider_item_uuid"])
+                    if key not in validated:
+                        if not validate_provider_item_exists(
+                            partition_key, provider_item["provider_item_uuid"]
+                        ):
+                            raise ValueError(
+                                f"Item at index {idx}, provider_item at index {provider_idx}: "
+                                f"provider_item_uuid '{provider_item['provider_item_uuid']}' does not exist"
+                            )
+                        validated.add(key)
 
                     # Validate batch_no if provided
                     if "batch_no" in provider_item and provider_item["batch_no"]:
+                        key = (
+                            "batch",
+                            provider_item["provider_item_uuid"],
+                            provider_item["batch_no"],
+                        )
+                        if key in validated:
+                            continue
                         if not validate_batch_exists(
                             provider_item["provider_item_uuid"],
                             provider_item["batch_no"],
@@ -288,6 +305,7 @@ def _validate_request_items(partition_key: str, items: list) -> None:
                                 f"batch_no '{provider_item['batch_no']}' does not exist for "
                                 f"provider_item_uuid '{provider_item['provider_item_uuid']}'"
                             )
+                        validated.add(key)
 
 
 @insert_update_decorator(
@@ -331,16 +331,8 @@ def combine_all_item_price_tiers(
                     item_data_map[key] = []
                 item_data_map[key].append(item)
 
-        # STEP 3: Load all price tiers in parallel using batch loader with segment filtering
-        tier_promises = []
+        # STEP 3: Load all price tiers in one batch with segment filtering
         key_list = list(item_keys)
-        for item_uuid, provider_item_uuid in key_list:
-            # Pass segment_uuid to the loader for efficient database-level filtering
-            tier_promises.append(
-                loaders.item_price_tier_by_provider_item_loader.load(
-                    (item_uuid, provider_item_uuid, seg_uuid)
-                )
-            )
 
         def process_tiers(all_tier_lists):
             """Process loaded price tiers and apply filtering/pricing logic."""
@@ -376,11 +368,16 @@ def combine_all_item_price_tiers(
             return result_tiers
 
         # If no items to process, return empty list
-        if not tier_promises:
+        if not key_list:
             return Promise.resolve([])
 
-        # Load all tiers and process them
-        return Promise.all(tier_promises).then(process_tiers)
+        # Pass segment_uuid to the loader for efficient database-level filtering
+        return loaders.item_price_tier_by_provider_item_loader.load_many(
+            [
+                (item_uuid, provider_item_uuid, seg_uuid)
+                for item_uuid, provider_item_uuid in key_list
+            ]
+        ).then(process_tiers)
 
     # Start by loading segment contact
     if email:
@@ -1,10 +1,9 @@
 # -*- coding: utf-8 -*-
-from __future__ import print_function
+from __future__ import annotations, print_function
 
 __author__ = "bibow"
 
-import traceback
-from typing import Any, Dict
+from typing import Any
 
 from graphene import Boolean, Field, Int, List, Mutation, String
 from silvaengine_utility import JSONCamelCase
@@ -13,6 +12,7 @@ from ..models.discount_prompt import (
     insert_update_discount_prompt,
 )
 from ..types.discount_prompt import DiscountPromptType
+from .utils import log_and_reraise
 
 
 class InsertUpdateDiscountPrompt(Mutation):
@@ -30,16 +30,9 @@ class InsertUpdateDiscountPrompt(Mutation):
         updated_by = String(required=True)
 
     @staticmethod
-    def mutate(
-        root: Any, info: Any, **kwargs: Dict[str, Any]
-    ) -> "InsertUpdateDiscountPrompt":
-        try:
-            discount_prompt = insert_update_discount_prompt(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "InsertUpdateDiscountPrompt":
+        discount_prompt = insert_update_discount_prompt(info, **kwargs)
         return InsertUpdateDiscountPrompt(discount_prompt=discount_prompt)
 
 
@@ -50,14 +43,7 @@ class DeleteDiscountPrompt(Mutation):
         discount_prompt_uuid = String(required=True)
 
     @staticmethod
-    def mutate(
-        root: Any, info: Any, **kwargs: Dict[str, Any]
-    ) -> "DeleteDiscountPrompt":
-        try:
-            ok = delete_discount_prompt(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "DeleteDiscountPrompt":
+        ok = delete_discount_prompt(info, **kwargs)
         return DeleteDiscountPrompt(ok=ok)
@@ -1,15 +1,15 @@
 # -*- coding: utf-8 -*-
-from __future__ import print_function
+from __future__ import annotations, print_function
 
 __author__ = "bibow"
 
-import traceback
-from typing import Any, Dict
+from typing import Any
 
 from graphene import Boolean, Field, Mutation, String
 
 from ..models.file import delete_file, insert_update_file
 from ..types.file import FileType
+from .utils import log_and_reraise
 
 
 class InsertUpdateFile(Mutation):
@@ -22,14 +22,9 @@ class InsertUpdateFile(Mutation):
         updated_by = String(required=True)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "InsertUpdateFile":
-        try:
-            file = insert_update_file(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "InsertUpdateFile":
+        file = insert_update_file(info, **kwargs)
         return InsertUpdateFile(file=file)
 
 
@@ -41,12 +36,7 @@ class DeleteFile(Mutation):
         file_name = String(required=True)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "DeleteFile":
-        try:
-            ok = delete_file(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "DeleteFile":
+        ok = delete_file(info, **kwargs)
         return DeleteFile(ok=ok)
@@ -1,15 +1,15 @@
-from __future__ import print_function
+from __future__ import annotations, print_function
 
 __author__ = "bibow"
 
-import traceback
-from typing import Any, Dict
+from typing import Any
 
 from graphene import Boolean, DateTime, Field, Int, Mutation, String
 from silvaengine_utility import SafeFloat as Float
 
 from ..models.installment import delete_installment, insert_update_installment
 from ..types.installment import InstallmentType
+from .utils import log_and_reraise
 
 
 class InsertUpdateInstallment(Mutation):
@@ -28,16 +28,9 @@ class InsertUpdateInstallment(Mutation):
         updated_by = String(required=True)
 
     @staticmethod
-    def mutate(
-        root: Any, info: Any, **kwargs: Dict[str, Any]
-    ) -> "InsertUpdateInstallment":
-        try:
-            installment = insert_update_installment(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "InsertUpdateInstallment":
+        installment = insert_update_installment(info, **kwargs)
         return InsertUpdateInstallment(installment=installment)
 
 
@@ -49,12 +42,7 @@ class DeleteInstallment(Mutation):
         installment_uuid = String(required=True)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "DeleteInstallment":
-        try:
-            ok = delete_installment(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "DeleteInstallment":
+        ok = delete_installment(info, **kwargs)
         return DeleteInstallment(ok=ok)
@@ -1,15 +1,15 @@
 # -*- coding: utf-8 -*-
-from __future__ import print_function
+from __future__ import annotations, print_function
 
 __author__ = "bibow"
 
-import traceback
-from typing import Any, Dict
+from typing import Any
 
 from graphene import Boolean, Field, Mutation, String
 
 from ..models.item import delete_item, insert_update_item
 from ..types.item import ItemType
+from .utils import log_and_reraise
 
 
 class InsertUpdateItem(Mutation):
@@ -25,14 +25,9 @@ class InsertUpdateItem(Mutation):
         updated_by = String(required=True)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "InsertUpdateItem":
-        try:
-            item = insert_update_item(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "InsertUpdateItem":
+        item = insert_update_item(info, **kwargs)
         return InsertUpdateItem(item=item)
 
 
@@ -43,12 +38,7 @@ class DeleteItem(Mutation):
         item_uuid = String(required=True)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "DeleteItem":
-        try:
-            ok = delete_item(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "DeleteItem":
+        ok = delete_item(info, **kwargs)
         return DeleteItem(ok=ok)
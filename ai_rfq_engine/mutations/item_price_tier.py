@@ -1,10 +1,9 @@
 # -*- coding: utf-8 -*-
-from __future__ import print_function
+from __future__ import annotations, print_function
 
 __author__ = "bibow"
 
-import traceback
-from typing import Any, Dict
+from typing import Any
 
 from graphene import Boolean, Field, Mutation, String
 from silvaengine_utility import SafeFloat as Float
@@ -14,6 +13,7 @@ from ..models.item_price_tier import (
     insert_update_item_price_tier,
 )
 from ..types.item_price_tier import ItemPriceTierType
+from .utils import log_and_reraise
 
 
 class InsertUpdateItemPriceTier(Mutation):
@@ -31,16 +31,9 @@ class InsertUpdateItemPriceTier(Mutation):
         updated_by = String(required=True)
 
     @staticmethod
-    def mutate(
-        root: Any, info: Any, **kwargs: Dict[str, Any]
-    ) -> "InsertUpdateItemPriceTier":
-        try:
-            item_price_tier = insert_update_item_price_tier(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "InsertUpdateItemPriceTier":
+        item_price_tier = insert_update_item_price_tier(info, **kwargs)
         return InsertUpdateItemPriceTier(item_price_tier=item_price_tier)
 
 
@@ -52,12 +45,7 @@ class DeleteItemPriceTier(Mutation):
         item_price_tier_uuid = String(required=True)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "DeleteItemPriceTier":
-        try:
-            ok = delete_item_price_tier(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "DeleteItemPriceTier":
+        ok = delete_item_price_tier(info, **kwargs)
         return DeleteItemPriceTier(ok=ok)
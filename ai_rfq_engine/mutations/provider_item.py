@@ -1,10 +1,9 @@
 # -*- coding: utf-8 -*-
-from __future__ import print_function
+from __future__ import annotations, print_function
 
 __author__ = "bibow"
 
-import traceback
-from typing import Any, Dict
+from typing import Any
 
 from graphene import Boolean, Field, Mutation, String
 from silvaengine_utility import JSONCamelCase
@@ -12,6 +11,7 @@ from silvaengine_utility import SafeFloat as Float
 
 from ..models.provider_item import delete_provider_item, insert_update_provider_item
 from ..types.provider_item import ProviderItemType
+from .utils import log_and_reraise
 
 
 class InsertUpdateProviderItem(Mutation):
@@ -27,16 +27,9 @@ class InsertUpdateProviderItem(Mutation):
         updated_by = String(required=True)
 
     @staticmethod
-    def mutate(
-        root: Any, info: Any, **kwargs: Dict[str, Any]
-    ) -> "InsertUpdateProviderItem":
-        try:
-            provider_item = insert_update_provider_item(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "InsertUpdateProviderItem":
+        provider_item = insert_update_provider_item(info, **kwargs)
         return InsertUpdateProviderItem(provider_item=provider_item)
 
 
@@ -47,12 +40,7 @@ class DeleteProviderItem(Mutation):
         provider_item_uuid = String(required=True)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "DeleteProviderItem":
-        try:
-            ok = delete_provider_item(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "DeleteProviderItem":
+        ok = delete_provider_item(info, **kwargs)
         return DeleteProviderItem(ok=ok)
@@ -1,10 +1,9 @@
 # -*- coding: utf-8 -*-
-from __future__ import print_function
+from __future__ import annotations, print_function
 
 __author__ = "bibow"
 
-import traceback
-from typing import Any, Dict
+from typing import Any
 
 from graphene import Boolean, DateTime, Field, Mutation, String
 from silvaengine_utility import SafeFloat as Float
@@ -14,6 +13,7 @@ from ..models.provider_item_batches import (
     insert_update_provider_item_batch,
 )
 from ..types.provider_item_batches import ProviderItemBatchType
+from .utils import log_and_reraise
 
 
 class InsertUpdateProviderItemBatch(Mutation):
@@ -34,16 +34,9 @@ class InsertUpdateProviderItemBatch(Mutation):
         updated_by = String(required=True)
 
     @staticmethod
-    def mutate(
-        root: Any, info: Any, **kwargs: Dict[str, Any]
-    ) -> "InsertUpdateProviderItemBatch":
-        try:
-            provider_item_batch = insert_update_provider_item_batch(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "InsertUpdateProviderItemBatch":
+        provider_item_batch = insert_update_provider_item_batch(info, **kwargs)
         return InsertUpdateProviderItemBatch(provider_item_batch=provider_item_batch)
 
 
@@ -55,14 +48,7 @@ class DeleteProviderItemBatch(Mutation):
         batch_no = String(required=True)
 
     @staticmethod
-    def mutate(
-        root: Any, info: Any, **kwargs: Dict[str, Any]
-    ) -> "DeleteProviderItemBatch":
-        try:
-            ok = delete_provider_item_batch(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "DeleteProviderItemBatch":
+        ok = delete_provider_item_batch(info, **kwargs)
         return DeleteProviderItemBatch(ok=ok)
@@ -1,16 +1,16 @@
 # -*- coding: utf-8 -*-
-from __future__ import print_function
+from __future__ import annotations, print_function
 
 __author__ = "bibow"
 
-import traceback
-from typing import Any, Dict
+from typing import Any
 
 from graphene import Boolean, Field, Mutation, String
 from silvaengine_utility import SafeFloat as Float
 
 from ..models.quote import delete_quote, insert_update_quote
 from ..types.quote import QuoteType
+from .utils import log_and_reraise
 
 
 class InsertUpdateQuote(Mutation):
@@ -28,14 +28,9 @@ class InsertUpdateQuote(Mutation):
         updated_by = String(required=True)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "InsertUpdateQuote":
-        try:
-            quote = insert_update_quote(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "InsertUpdateQuote":
+        quote = insert_update_quote(info, **kwargs)
         return InsertUpdateQuote(quote=quote)
 
 
@@ -47,12 +42,7 @@ class DeleteQuote(Mutation):
         quote_uuid = String(required=True)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "DeleteQuote":
-        try:
-            ok = delete_quote(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "DeleteQuote":
+        ok = delete_quote(info, **kwargs)
         return DeleteQuote(ok=ok)
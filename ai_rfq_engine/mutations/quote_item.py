@@ -1,18 +1,22 @@
 # -*- coding: utf-8 -*-
-from __future__ import print_function
+from __future__ import annotations, print_function
 
 __author__ = "bibow"
 
-import traceback
-from typing import Any, Dict
+from typing import Any
 
-from graphene import Boolean, Field, Mutation, String
+from graphene import Boolean, Field, List, Mutation, String
 
 from silvaengine_utility import JSONCamelCase
 from silvaengine_utility import SafeFloat as Float
 
-from ..models.quote_item import delete_quote_item, insert_update_quote_item
+from ..models.quote_item import (
+    delete_quote_item,
+    insert_quote_items,
+    insert_update_quote_item,
+)
 from ..types.quote_item import QuoteItemType
+from .utils import log_and_reraise
 
 
 class InsertUpdateQuoteItem(Mutation):
@@ -33,19 +37,28 @@ class InsertUpdateQuoteItem(Mutation):
         updated_by = String(required=True)
 
     @staticmethod
-    def mutate(
-        root: Any, info: Any, **kwargs: Dict[str, Any]
-    ) -> "InsertUpdateQuoteItem":
-        try:
-            quote_item = insert_update_quote_item(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "InsertUpdateQuoteItem":
+        quote_item = insert_update_quote_item(info, **kwargs)
         return InsertUpdateQuoteItem(quote_item=quote_item)
 
 
+class BatchInsertQuoteItems(Mutation):
+    quote_items = List(QuoteItemType)
+
+    class Arguments:
+        quote_uuid = String(required=True)
+        request_uuid = String(required=True)
+        items = List(JSONCamelCase, required=True)
+        updated_by = String(required=True)
+
+    @staticmethod
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "BatchInsertQuoteItems":
+        quote_items = insert_quote_items(info, **kwargs)
+        return BatchInsertQuoteItems(quote_items=quote_items)
+
+
 class DeleteQuoteItem(Mutation):
     ok = Boolean()
 
@@ -54,12 +67,7 @@ class DeleteQuoteItem(Mutation):
         quote_item_uuid = String(required=True)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "DeleteQuoteItem":
-        try:
-            ok = delete_quote_item(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "DeleteQuoteItem":
+        ok = delete_quote_item(info, **kwargs)
         return DeleteQuoteItem(ok=ok)
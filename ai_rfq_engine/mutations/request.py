@@ -1,16 +1,16 @@
 # -*- coding: utf-8 -*-
-from __future__ import print_function
+from __future__ import annotations, print_function
 
 __author__ = "bibow"
 
-import traceback
-from typing import Any, Dict
+from typing import Any
 
 from graphene import Boolean, DateTime, Field, List, Mutation, String
 from silvaengine_utility import JSONCamelCase
 
 from ..models.request import delete_request, insert_update_request
 from ..types.request import RequestType
+from .utils import log_and_reraise
 
 
 class InsertUpdateRequest(Mutation):
@@ -30,14 +30,9 @@ class InsertUpdateRequest(Mutation):
         updated_by = String(required=True)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "InsertUpdateRequest":
-        try:
-            request = insert_update_request(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "InsertUpdateRequest":
+        request = insert_update_request(info, **kwargs)
         return InsertUpdateRequest(request=request)
 
 
@@ -48,12 +43,7 @@ class DeleteRequest(Mutation):
         request_uuid = String(required=True)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "DeleteRequest":
-        try:
-            ok = delete_request(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "DeleteRequest":
+        ok = delete_request(info, **kwargs)
         return DeleteRequest(ok=ok)
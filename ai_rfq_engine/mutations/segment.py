@@ -1,15 +1,15 @@
 # -*- coding: utf-8 -*-
-from __future__ import print_function
+from __future__ import annotations, print_function
 
 __author__ = "bibow"
 
-import traceback
-from typing import Any, Dict
+from typing import Any
 
 from graphene import Boolean, Field, Mutation, String
 
 from ..models.segment import delete_segment, insert_update_segment
 from ..types.segment import SegmentType
+from .utils import log_and_reraise
 
 
 class InsertUpdateSegment(Mutation):
@@ -23,14 +23,9 @@ class InsertUpdateSegment(Mutation):
         updated_by = String(required=True)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "InsertUpdateSegment":
-        try:
-            segment = insert_update_segment(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "InsertUpdateSegment":
+        segment = insert_update_segment(info, **kwargs)
         return InsertUpdateSegment(segment=segment)
 
 
@@ -41,12 +36,7 @@ class DeleteSegment(Mutation):
         segment_uuid = String(required=False)
 
     @staticmethod
-    def mutate(root: Any, info: Any, **kwargs: Dict[str, Any]) -> "DeleteSegment":
-        try:
-            ok = delete_segment(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "DeleteSegment":
+        ok = delete_segment(info, **kwargs)
         return DeleteSegment(ok=ok)
@@ -1,10 +1,9 @@
 # -*- coding: utf-8 -*-
-from __future__ import print_function
+from __future__ import annotations, print_function
 
 __author__ = "bibow"
 
-import traceback
-from typing import Any, Dict
+from typing import Any
 
 from graphene import Boolean, Field, Mutation, String
 
@@ -13,6 +12,7 @@ from ..models.segment_contact import (
     insert_update_segment_contact,
 )
 from ..types.segment_contact import SegmentContactType
+from .utils import log_and_reraise
 
 
 class InsertUpdateSegmentContact(Mutation):
@@ -26,16 +26,9 @@ class InsertUpdateSegmentContact(Mutation):
         updated_by = String(required=True)
 
     @staticmethod
-    def mutate(
-        root: Any, info: Any, **kwargs: Dict[str, Any]
-    ) -> "InsertUpdateSegmentContact":
-        try:
-            segment_contact = insert_update_segment_contact(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "InsertUpdateSegmentContact":
+        segment_contact = insert_update_segment_contact(info, **kwargs)
         return InsertUpdateSegmentContact(segment_contact=segment_contact)
 
 
@@ -47,14 +40,7 @@ class DeleteSegmentContact(Mutation):
         email = String(required=True)
 
     @staticmethod
-    def mutate(
-        root: Any, info: Any, **kwargs: Dict[str, Any]
-    ) -> "DeleteSegmentContact":
-        try:
-            ok = delete_segment_contact(info, **kwargs)
-        except Exception as e:
-            log = traceback.format_exc()
-            info.context.get("logger").error(log)
-            raise e
-
+    @log_and_reraise
+    def mutate(root: Any, info: Any, **kwargs: Any) -> "DeleteSegmentContact":
+        ok = delete_segment_contact(info, **kwargs)
         return DeleteSegmentContact(ok=ok)
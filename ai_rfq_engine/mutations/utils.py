@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations, print_function
+
+__author__ = "bibow"
+
+import functools
+from typing import Any, Callable
+
+
+def log_and_reraise(mutate: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Log any exception raised by a Mutation.mutate with its traceback, then re-raise.
+
+    logger.exception defers formatting the traceback to the logging handler,
+    so nothing is rendered when the record is filtered out.
+    """
+
+    @functools.wraps(mutate)
+    def wrapper(root: Any, info: Any, **kwargs: Any) -> Any:
+        try:
+            return mutate(root, info, **kwargs)
+        except Exception:
+            info.context.get("logger").exception(f"{mutate.__qualname__} failed.")
+            raise
+
+    return wrapper
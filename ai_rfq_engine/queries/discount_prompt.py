@@ -12,6 +12,7 @@ from silvaengine_utility import Debugger, method_cache
 from ..handlers.config import Config
 from ..models import discount_prompt
 from ..models.batch_loaders import get_loaders
+from ..models.utils import combine_all_discount_prompts
 from ..types.discount_prompt import DiscountPromptListType, DiscountPromptType
 
 
@@ -40,8 +41,6 @@ def resolve_discount_prompt_list(
 def resolve_discount_prompts(
     info: ResolveInfo, **kwargs: Dict[str, Any]
 ) -> List[DiscountPromptType]:
-    from ..models.utils import combine_all_discount_prompts
-
     Debugger.info(
         variable=f"{__name__}:resolve_discount_prompts",
         stage=__name__,
@@ -11,11 +11,20 @@ from silvaengine_utility import method_cache
 
 from ..handlers.config import Config
 from ..models import item
+from ..models.batch_loaders import get_loaders
 from ..types.item import ItemListType, ItemType
 
 
 def resolve_item(info: ResolveInfo, **kwargs: Dict[str, Any]) -> ItemType | None:
-    return item.resolve_item(info, **kwargs)
+    # Lookups by external id need an index query; lookups by uuid share the
+    # request-scoped loader with nested item lookups
+    if kwargs.get("item_external_id") or not kwargs.get("item_uuid"):
+        return item.resolve_item(info, **kwargs)
+
+    loaders = get_loaders(info.context)
+    return loaders.item_loader.load(
+        (info.context.get("partition_key"), kwargs["item_uuid"])
+    ).then(lambda item_dict: ItemType(**item_dict) if item_dict else None)
 
 
 @method_cache(
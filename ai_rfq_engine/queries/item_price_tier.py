@@ -7,11 +7,14 @@ __author__ = "bibow"
 from typing import Any, Dict, List
 
 from graphene import ResolveInfo
+from promise import Promise
 from silvaengine_utility import method_cache
 
 from ..handlers.config import Config
 from ..models import item_price_tier
 from ..models.batch_loaders import get_loaders
+from ..models.item_price_tier import get_item_price_tier_type
+from ..models.utils import combine_all_item_price_tiers
 from ..types.item_price_tier import ItemPriceTierListType, ItemPriceTierType
 
 
@@ -54,21 +57,25 @@ def resolve_item_price_tiers(
     Returns:
         Promise that resolves to list of ItemPriceTierType objects with price tier information
     """
-    from ..models.item_price_tier import get_item_price_tier_type
-    from ..models.utils import combine_all_item_price_tiers
+    quote_items = kwargs.get("quote_items", [])
+    if not quote_items:
+        return Promise.resolve([])
 
     loaders = get_loaders(info.context)
     partition_key = info.context.get("partition_key")
     email = kwargs.get("email")
-    quote_items = kwargs.get("quote_items", [])
 
-    # Get tier models from utility function, then convert to types
-    def convert_to_types(tier_models):
-        """Convert ItemPriceTierModel instances to ItemPriceTierType."""
-        return [
-            get_item_price_tier_type(info, tier_model) for tier_model in tier_models
-        ]
+    # Quote items on the same provider item match the same tiers, so convert
+    # each tier only once per call
+    tier_types: Dict[str, ItemPriceTierType] = {}
 
+    def to_type(tier_model):
+        key = tier_model.item_price_tier_uuid
+        if key not in tier_types:
+            tier_types[key] = get_item_price_tier_type(info, tier_model)
+        return tier_types[key]
+
+    # Get tier models from utility function, then convert to types
     return combine_all_item_price_tiers(
         partition_key, email, quote_items, loaders
-    ).then(convert_to_types)
+    ).then(lambda tier_models: list(map(to_type, tier_models)))
@@ -11,13 +11,22 @@ from silvaengine_utility import method_cache
 
 from ..handlers.config import Config
 from ..models import provider_item
+from ..models.batch_loaders import get_loaders
 from ..types.provider_item import ProviderItemListType, ProviderItemType
 
 
 def resolve_provider_item(
     info: ResolveInfo, **kwargs: Dict[str, Any]
 ) -> ProviderItemType | None:
-    return provider_item.resolve_provider_item(info, **kwargs)
+    # Lookups by external id need an index query; lookups by uuid share the
+    # request-scoped loader with nested provider item lookups
+    if kwargs.get("provider_item_external_id") or not kwargs.get("provider_item_uuid"):
+        return provider_item.resolve_provider_item(info, **kwargs)
+
+    loaders = get_loaders(info.context)
+    return loaders.provider_item_loader.load(
+        (info.context.get("partition_key"), kwargs["provider_item_uuid"])
+    ).then(lambda pi_dict: ProviderItemType(**pi_dict) if pi_dict else None)
 
 
 @method_cache(
@@ -11,6 +11,7 @@ from silvaengine_utility import method_cache
 
 from ..handlers.config import Config
 from ..models import provider_item_batches
+from ..models.batch_loaders import get_loaders
 from ..types.provider_item_batches import (
     ProviderItemBatchListType,
     ProviderItemBatchType,
@@ -20,7 +21,14 @@ from ..types.provider_item_batches import (
 def resolve_provider_item_batch(
     info: ResolveInfo, **kwargs: Dict[str, Any]
 ) -> ProviderItemBatchType | None:
-    return provider_item_batches.resolve_provider_item_batch(info, **kwargs)
+    # Share the request-scoped loader with nested batch lookups; a missing
+    # batch resolves to None, so no separate count query is needed
+    loaders = get_loaders(info.context)
+    return loaders.provider_item_batch_loader.load(
+        (kwargs["provider_item_uuid"], kwargs["batch_no"])
+    ).then(
+        lambda batch_dict: ProviderItemBatchType(**batch_dict) if batch_dict else None
+    )
 
 
 @method_cache(
@@ -12,11 +12,17 @@ from silvaengine_utility import method_cache
 
 from ..handlers.config import Config
 from ..models import quote
+from ..models.batch_loaders import get_loaders
 from ..types.quote import QuoteListType, QuoteType
 
 
 def resolve_quote(info: ResolveInfo, **kwargs: Dict[str, Any]) -> QuoteType | None:
-    return quote.resolve_quote(info, **kwargs)
+    # Share the request-scoped loader with nested quote lookups; a missing
+    # quote resolves to None, so no separate count query is needed
+    loaders = get_loaders(info.context)
+    return loaders.quote_loader.load(
+        (kwargs["request_uuid"], kwargs["quote_uuid"])
+    ).then(lambda quote_dict: QuoteType(**quote_dict) if quote_dict else None)
 
 
 @method_cache(
@@ -11,11 +11,17 @@ from silvaengine_utility import method_cache
 
 from ..handlers.config import Config
 from ..models import request
+from ..models.batch_loaders import get_loaders
 from ..types.request import RequestListType, RequestType
 
 
 def resolve_request(info: ResolveInfo, **kwargs: Dict[str, Any]) -> RequestType | None:
-    return request.resolve_request(info, **kwargs)
+    # Share the request-scoped loader with nested request lookups; a missing
+    # request resolves to None, so no separate count query is needed
+    loaders = get_loaders(info.context)
+    return loaders.request_loader.load(
+        (info.context.get("partition_key"), kwargs["request_uuid"])
+    ).then(lambda request_dict: RequestType(**request_dict) if request_dict else None)
 
 
 @method_cache(
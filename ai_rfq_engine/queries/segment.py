@@ -11,11 +11,17 @@ from silvaengine_utility import method_cache
 
 from ..handlers.config import Config
 from ..models import segment
+from ..models.batch_loaders import get_loaders
 from ..types.segment import SegmentListType, SegmentType
 
 
 def resolve_segment(info: ResolveInfo, **kwargs: Dict[str, Any]) -> SegmentType | None:
-    return segment.resolve_segment(info, **kwargs)
+    # Share the request-scoped loader with nested segment lookups; a missing
+    # segment resolves to None, so no separate count query is needed
+    loaders = get_loaders(info.context)
+    return loaders.segment_loader.load(
+        (info.context.get("partition_key"), kwargs["segment_uuid"])
+    ).then(lambda segment_dict: SegmentType(**segment_dict) if segment_dict else None)
 
 
 @method_cache(
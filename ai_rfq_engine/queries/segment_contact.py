@@ -11,13 +11,26 @@ from silvaengine_utility import method_cache
 
 from ..handlers.config import Config
 from ..models import segment_contact
+from ..models.batch_loaders import get_loaders
 from ..types.segment_contact import SegmentContactListType, SegmentContactType
 
 
 def resolve_segment_contact(
     info: ResolveInfo, **kwargs: Dict[str, Any]
 ) -> SegmentContactType | None:
-    return segment_contact.resolve_segment_contact(info, **kwargs)
+    # Filtering by segment_uuid needs the segment index; a plain email lookup
+    # shares the request-scoped loader used for discount and tier lookups
+    if kwargs.get("segment_uuid"):
+        return segment_contact.resolve_segment_contact(info, **kwargs)
+
+    loaders = get_loaders(info.context)
+    return loaders.segment_contact_loader.load(
+        (info.context.get("partition_key"), kwargs["email"])
+    ).then(
+        lambda contact_dict: (
+            SegmentContactType(**contact_dict) if contact_dict else None
+        )
+    )
 
 
 @method_cache(
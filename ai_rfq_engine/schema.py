@@ -32,7 +32,11 @@ from .mutations.provider_item_batches import (
     InsertUpdateProviderItemBatch,
 )
 from .mutations.quote import DeleteQuote, InsertUpdateQuote
-from .mutations.quote_item import DeleteQuoteItem, InsertUpdateQuoteItem
+from .mutations.quote_item import (
+    BatchInsertQuoteItems,
+    DeleteQuoteItem,
+    InsertUpdateQuoteItem,
+)
 from .mutations.request import DeleteRequest, InsertUpdateRequest
 from .mutations.segment import DeleteSegment, InsertUpdateSegment
 from .mutations.segment_contact import DeleteSegmentContact, InsertUpdateSegmentContact
@@ -78,34 +82,36 @@ from .types.request import RequestListType, RequestType
 from .types.segment import SegmentListType, SegmentType
 from .types.segment_contact import SegmentContactListType, SegmentContactType
 
+TYPE_CLASSES = (
+    DiscountPromptType,
+    DiscountPromptListType,
+    FileType,
+    FileListType,
+    InstallmentType,
+    InstallmentListType,
+    ItemType,
+    ItemListType,
+    ItemPriceTierType,
+    ItemPriceTierListType,
+    ProviderItemType,
+    ProviderItemListType,
+    ProviderItemBatchType,
+    ProviderItemBatchListType,
+    QuoteType,
+    QuoteListType,
+    QuoteItemType,
+    QuoteItemListType,
+    RequestType,
+    RequestListType,
+    SegmentType,
+    SegmentListType,
+    SegmentContactType,
+    SegmentContactListType,
+)
+
 
 def type_class():
-    return [
-        DiscountPromptType,
-        DiscountPromptListType,
-        FileType,
-        FileListType,
-        InstallmentType,
-        InstallmentListType,
-        ItemType,
-        ItemListType,
-        ItemPriceTierType,
-        ItemPriceTierListType,
-        ProviderItemType,
-        ProviderItemListType,
-        ProviderItemBatchType,
-        ProviderItemBatchListType,
-        QuoteType,
-        QuoteListType,
-        QuoteItemType,
-        QuoteItemListType,
-        RequestType,
-        RequestListType,
-        SegmentType,
-        SegmentListType,
-        SegmentContactType,
-        SegmentContactListType,
-    ]
+    return TYPE_CLASSES
 
 
 class Query(ObjectType):
@@ -506,6 +512,7 @@ class Mutations(ObjectType):
     insert_update_quote = InsertUpdateQuote.Field()
     delete_quote = DeleteQuote.Field()
     insert_update_quote_item = InsertUpdateQuoteItem.Field()
+    batch_insert_quote_items = BatchInsertQuoteItems.Field()
     delete_quote_item = DeleteQuoteItem.Field()
     insert_update_installment = InsertUpdateInstallment.Field()
     delete_installment = DeleteInstallment.Field()
@@ -5,10 +5,10 @@ from __future__ import annotations
 
 __author__ = "bibow"
 
+import heapq
 import json
 import logging
 import os
-import re
 import sys
 from typing import Any, Dict, Sequence
 
@@ -151,10 +151,8 @@ def pytest_addoption(parser: pytest.Parser) -> None:
 
 def _parse_marker_filter(raw: str) -> list[str]:
     """Parse comma/space separated marker string into list."""
-    if not raw:
-        return []
-    parts = re.split(r"[,\s]+", raw.strip())
-    return [part for part in parts if part]
+    # str.split() with no separator collapses whitespace runs and drops empties
+    return raw.replace(",", " ").split()
 
 
 def _format_filter_description(target: str, marker_filter_raw: str) -> str:
@@ -169,7 +167,7 @@ def _format_filter_description(target: str, marker_filter_raw: str) -> str:
 
 def _raise_no_matches(filters_desc: str, items: Sequence[pytest.Item]) -> None:
     """Raise informative error when no tests matched filter."""
-    sample = ", ".join(sorted(item.name for item in items)[:5])
+    sample = ", ".join(heapq.nsmallest(5, (item.name for item in items)))
     hint = f" Available sample: {sample}" if sample else ""
     raise pytest.UsageError(f"{filters_desc} did not match any collected tests.{hint}")
 
@@ -187,24 +185,29 @@ def pytest_collection_modifyitems(
     """
     target = config.getoption("--test-function")
     marker_filter_raw = config.getoption("--test-markers")
-    markers = _parse_marker_filter(marker_filter_raw)
 
-    if not target and not markers:
+    if not target and not marker_filter_raw:
         return  # No filtering requested
 
+    markers = _parse_marker_filter(marker_filter_raw)
+    if not target and not markers:
+        return  # Marker filter held only separators
+
     target_lower = target.lower()
+    marker_set = set(markers)
     selected: list[pytest.Item] = []
     deselected: list[pytest.Item] = []
 
     for item in items:
-        # Extract function name without parameters
-        test_func_name = item.name.split("[")[0].lower()
-
-        # Check if name matches (exact match)
-        name_match = not target_lower or test_func_name == target_lower
+        # Check if the function name without parameters matches (exact match)
+        name_match = (
+            not target_lower or item.name.partition("[")[0].lower() == target_lower
+        )
 
         # Check if any requested marker is present
-        marker_match = not markers or any(item.get_closest_marker(m) for m in markers)
+        marker_match = not marker_set or not marker_set.isdisjoint(
+            marker.name for marker in item.iter_markers()
+        )
 
         if name_match and marker_match:
             selected.append(item)
@@ -2,12 +2,12 @@ import json
 import logging
 import os
 import random
+import re
 import sys
 import time
-import uuid
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
-import pendulum
 from dotenv import load_dotenv
 
 # Load .env from current directory (tests folder) before setting up paths
@@ -36,8 +36,10 @@ except ModuleNotFoundError:
     )
     exit(1)
 
+# Per-row progress is logged at DEBUG; set log_level=WARNING to keep CI quiet.
 logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    level=os.getenv("log_level", "INFO").upper(),
+    format="%(asctime)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger("load_sample_data")
 
@@ -71,6 +73,206 @@ NUM_QUOTES_PER_REQUEST = 2
 NUM_QUOTE_ITEMS_PER_QUOTE = 3
 NUM_INSTALLMENTS_PER_QUOTE = 2
 NUM_FILES_PER_REQUEST = 1
+ADDRESS_POOL_SIZE = 20
+# Entities recorded in test_data.json, each with *_test_data,
+# *_get_test_data and *_list_test_data lists.
+TEST_DATA_ENTITIES = (
+    "segment",
+    "segment_contact",
+    "item",
+    "provider_item",
+    "provider_item_batch",
+    "item_price_tier",
+    "discount_prompt",
+    "request",
+    "quote",
+    "quote_item",
+    "installment",
+)
+# Concurrent engine calls for rows that do not depend on each other.
+MAX_WORKERS = int(os.getenv("max_workers", "8"))
+
+
+# --- GRAPHQL DOCUMENTS ---
+SEGMENT_MUTATION = """
+mutation InsertUpdateSegment($name: String, $desc: String, $by: String!) {
+    insertUpdateSegment(segmentName: $name, segmentDescription: $desc, updatedBy: $by) {
+        segment { segmentUuid }
+    }
+}
+"""
+
+SEGMENT_CONTACT_MUTATION = """
+mutation InsertUpdateSegmentContact($sid: String!, $email: String!, $cid: String, $by: String!) {
+    insertUpdateSegmentContact(segmentUuid: $sid, email: $email, consumerCorpExternalId: $cid, updatedBy: $by) {
+        segmentContact { contactUuid }
+    }
+}
+"""
+
+ITEM_MUTATION = """
+mutation InsertUpdateItem($type: String, $name: String, $desc: String, $uom: String, $by: String!) {
+    insertUpdateItem(itemType: $type, itemName: $name, itemDescription: $desc, uom: $uom, updatedBy: $by) {
+        item { itemUuid }
+    }
+}
+"""
+
+PROVIDER_ITEM_MUTATION = """
+mutation InsertUpdateProviderItem($itemId: String!, $provId: String, $price: Float, $by: String!) {
+    insertUpdateProviderItem(itemUuid: $itemId, providerCorpExternalId: $provId, basePricePerUom: $price, updatedBy: $by) {
+        providerItem { providerItemUuid }
+    }
+}
+"""
+
+PROVIDER_ITEM_BATCH_FIELD = """
+insertUpdateProviderItemBatch(providerItemUuid: $pid, itemUuid: $iid, batchNo: $bno, expiredAt: $exp, producedAt: $prod, costPerUom: $cost, additionalCostPerUom: $addCost, freightCostPerUom: $freightCost, inStock: $stock, updatedBy: $by) {
+    providerItemBatch { batchNo }
+}
+"""
+PROVIDER_ITEM_BATCH_VARIABLE_TYPES = {
+    "pid": "String!",
+    "iid": "String!",
+    "bno": "String!",
+    "exp": "DateTime",
+    "prod": "DateTime",
+    "cost": "Float",
+    "addCost": "Float",
+    "freightCost": "Float",
+    "stock": "Boolean",
+    "by": "String!",
+}
+
+ITEM_PRICE_TIER_FIELD = """
+insertUpdateItemPriceTier(itemUuid: $iid, providerItemUuid: $pid, segmentUuid: $sid, quantityGreaterThen: $qty, marginPerUom: $margin, status: $stat, updatedBy: $by) {
+    itemPriceTier { itemPriceTierUuid }
+}
+"""
+ITEM_PRICE_TIER_VARIABLE_TYPES = {
+    "iid": "String!",
+    "pid": "String",
+    "sid": "String",
+    "qty": "Float",
+    "margin": "Float",
+    "stat": "String",
+    "by": "String!",
+}
+
+DISCOUNT_PROMPT_FIELD = """
+insertUpdateDiscountPrompt(scope: $scope, tags: $tags, discountPrompt: $prompt, status: $stat, updatedBy: $by) {
+    discountPrompt { discountPromptUuid }
+}
+"""
+DISCOUNT_PROMPT_VARIABLE_TYPES = {
+    "scope": "String!",
+    "tags": "[String]",
+    "prompt": "String!",
+    "stat": "String",
+    "by": "String!",
+}
+
+REQUEST_MUTATION = """
+mutation InsertUpdateRequest(
+    $email: String!,
+    $title: String!,
+    $desc: String,
+    $billing: JSONCamelCase,
+    $shipping: JSONCamelCase,
+    $items: [JSONCamelCase],
+    $notes: String,
+    $status: String,
+    $expired: DateTime,
+    $by: String!
+) {
+    insertUpdateRequest(
+        email: $email,
+        requestTitle: $title,
+        requestDescription: $desc,
+        billingAddress: $billing,
+        shippingAddress: $shipping,
+        items: $items,
+        notes: $notes,
+        status: $status,
+        expiredAt: $expired,
+        updatedBy: $by
+    ) {
+        request { requestUuid }
+    }
+}
+"""
+
+QUOTE_MUTATION = """
+mutation InsertUpdateQuote(
+    $rid: String!,
+    $provId: String,
+    $salesEmail: String,
+    $notes: String,
+    $status: String,
+    $by: String!
+) {
+    insertUpdateQuote(
+        requestUuid: $rid,
+        providerCorpExternalId: $provId,
+        salesRepEmail: $salesEmail,
+        notes: $notes,
+        status: $status,
+        updatedBy: $by
+    ) {
+        quote { quoteUuid }
+    }
+}
+"""
+
+QUOTE_ITEM_MUTATION = """
+mutation InsertUpdateQuoteItem(
+    $qid: String!,
+    $rid: String,
+    $iid: String,
+    $pid: String,
+    $sid: String,
+    $qty: Float,
+    $by: String!
+) {
+    insertUpdateQuoteItem(
+        quoteUuid: $qid,
+        requestUuid: $rid,
+        itemUuid: $iid,
+        providerItemUuid: $pid,
+        segmentUuid: $sid,
+        qty: $qty,
+        updatedBy: $by
+    ) {
+        quoteItem { quoteItemUuid }
+    }
+}
+"""
+
+INSTALLMENT_MUTATION = """
+mutation InsertUpdateInstallment(
+    $qid: String!,
+    $rid: String,
+    $priority: Int,
+    $scheduled: DateTime,
+    $amount: SafeFloat,
+    $payment: String,
+    $status: String,
+    $by: String!
+) {
+    insertUpdateInstallment(
+        quoteUuid: $qid,
+        requestUuid: $rid,
+        priority: $priority,
+        scheduledDate: $scheduled,
+        installmentAmount: $amount,
+        paymentMethod: $payment,
+        status: $status,
+        updatedBy: $by
+    ) {
+        installment { installmentUuid }
+    }
+}
+"""
 
 
 def create_engine():
@@ -84,8 +286,8 @@ def create_engine():
         raise
 
 
-def run_graphql_mutation(engine, query, variables):
-    """Execute a GraphQL mutation through the local engine."""
+def execute_graphql(engine, query, variables):
+    """Execute a GraphQL document and return the decoded response, or None."""
     try:
         response = engine.ai_rfq_graphql(
             query=query,
@@ -99,30 +301,87 @@ def run_graphql_mutation(engine, query, variables):
             else response
         )
     except Exception as exc:
-        print(f"GraphQL execution failed: {exc}")
+        logger.error(f"GraphQL execution failed: {exc}")
         return None
 
-    # Handle Lambda-style response format with body field
-    if "body" in parsed and isinstance(parsed["body"], str):
+    if not parsed:
+        logger.error(f"GraphQL Error: No data returned.")
+        return None
+
+    # Handle Lambda-style response format with body field. The local engine
+    # returns the result dict directly, so this is a single lookup there.
+    body = parsed.get("body")
+    if isinstance(body, str):
         try:
-            body_data = Serializer.json_loads(parsed["body"])
-            parsed = body_data
+            parsed = Serializer.json_loads(body)
         except Exception:
             pass
 
-    if parsed.get("errors"):
-        print("GraphQL Error:", Serializer.json_dumps(parsed["errors"]))
+    return parsed
+
+
+def run_graphql_mutation(engine, query, variables):
+    """Execute a GraphQL mutation through the local engine."""
+    parsed = execute_graphql(engine, query, variables)
+    if parsed is None:
         return None
 
-    data = parsed
-    if not data:
-        print(f"GraphQL Error: No data returned.")
+    errors = parsed.get("errors")
+    if errors:
+        logger.error(f"GraphQL Error: {Serializer.json_dumps(errors)}")
         return None
 
-    print(f"  -> Success: {query.strip().splitlines()[0]} ...")
-    if "data" in data:
-        return data["data"]
-    return data
+    logger.debug(f"  -> Success: {query.strip().splitlines()[0]} ...")
+    return parsed.get("data", parsed)
+
+
+def run_graphql_batch(engine, operation, field, variable_types, variables_list):
+    """
+    Execute several calls of the same mutation field in one GraphQL document.
+
+    Each entry in variables_list becomes an aliased selection (m0, m1, ...)
+    with its variables suffixed by the entry index, so the engine is invoked
+    once for the whole batch. Returns the per-alias payloads in input order;
+    an alias that failed is None while the others keep their results, and
+    every entry is None when the document itself could not be executed.
+    """
+    if not variables_list:
+        return []
+
+    definitions = []
+    selections = []
+    variables = {}
+    for index, entry in enumerate(variables_list):
+        for name, graphql_type in variable_types.items():
+            definitions.append(f"${name}{index}: {graphql_type}")
+            variables[f"{name}{index}"] = entry[name]
+        selections.append(
+            f"m{index}: "
+            + re.sub(r"\$(\w+)", lambda match: f"${match.group(1)}{index}", field)
+        )
+
+    query = (
+        f"mutation {operation}({', '.join(definitions)}) "
+        f"{{ {' '.join(selections)} }}"
+    )
+    parsed = execute_graphql(engine, query, variables)
+    if parsed is None:
+        return [None] * len(variables_list)
+
+    # Field errors only null out their own alias; report them per alias.
+    for error in parsed.get("errors") or []:
+        path = error.get("path") or ["document"]
+        logger.error(
+            f"GraphQL Error in {operation}.{path[0]}: {Serializer.json_dumps(error)}"
+        )
+
+    data = parsed.get("data") or {}
+    results = [data.get(f"m{index}") for index in range(len(variables_list))]
+    logger.debug(
+        f"  -> {operation}: {sum(1 for result in results if result)}"
+        f"/{len(results)} succeeded"
+    )
+    return results
 
 
 def persist_test_data(test_data_updates):
@@ -141,62 +400,44 @@ def persist_test_data(test_data_updates):
         else:
             final_data[key] = [random.choice(records)]
 
+    # Encode in one pass and write once; json.dump issues a write per token.
     with open(TEST_DATA_FILE, "w") as f:
-        json.dump(final_data, f, indent=2)
-    print(f"\nTest data written to: {TEST_DATA_FILE}")
+        f.write(json.dumps(final_data, indent=2))
+    logger.info(f"Test data written to: {TEST_DATA_FILE}")
 
 
 def generate_and_load_data(engine):
     """Main function to generate and load all data."""
 
+    # One reference time for every produced/expired/scheduled offset in the run
+    now_utc = datetime.now(timezone.utc)
+
     # --- DATA STORAGE ---
     # These will map our locally generated IDs to the actual UUIDs returned by the API
     segment_map = {}
     item_map = {}
     provider_item_map = {}
     test_data_updates = {
-        "segment_test_data": [],
-        "segment_get_test_data": [],
-        "segment_list_test_data": [],
-        "segment_contact_test_data": [],
-        "segment_contact_get_test_data": [],
-        "segment_contact_list_test_data": [],
-        "item_test_data": [],
-        "item_get_test_data": [],
-        "item_list_test_data": [],
-        "provider_item_test_data": [],
-        "provider_item_get_test_data": [],
-        "provider_item_list_test_data": [],
-        "provider_item_batch_test_data": [],
-        "provider_item_batch_get_test_data": [],
-        "provider_item_batch_list_test_data": [],
-        "item_price_tier_test_data": [],
-        "item_price_tier_get_test_data": [],
-        "item_price_tier_list_test_data": [],
-        "discount_prompt_test_data": [],
-        "discount_prompt_get_test_data": [],
-        "discount_prompt_list_test_data": [],
-        "request_test_data": [],
-        "request_get_test_data": [],
-        "request_list_test_data": [],
-        "quote_test_data": [],
-        "quote_get_test_data": [],
-        "quote_list_test_data": [],
-        "quote_item_test_data": [],
-        "quote_item_get_test_data": [],
-        "quote_item_list_test_data": [],
-        "installment_test_data": [],
-        "installment_get_test_data": [],
-        "installment_list_test_data": [],
+        f"{entity}_{suffix}": []
+        for entity in TEST_DATA_ENTITIES
+        for suffix in ("test_data", "get_test_data", "list_test_data")
     }
+    list_test_data_seen = set()
+
+    def add_list_test_data(key, record):
+        # Rows of one entity mostly share the same list arguments; keep one copy.
+        marker = (key, tuple(record.items()))
+        if marker not in list_test_data_seen:
+            list_test_data_seen.add(marker)
+            test_data_updates[key].append(record)
 
     # 1. Segments
-    print("--- Loading Segments ---")
+    logger.info("--- Loading Segments ---")
     local_segments = []
     for i in range(NUM_SEGMENTS):
         local_segments.append(
             {
-                "local_id": str(uuid.uuid4()),
+                "local_id": f"segment_{i}",
                 "name": f"{fake.company()} Tier",
                 "description": fake.catch_phrase(),
             }
@@ -206,30 +447,23 @@ def generate_and_load_data(engine):
         None  # Will store the first segment UUID for reuse across sections
     )
     for segment_data in local_segments:
-        print(f"Creating Segment: {segment_data['name']}...")
-        mutation = """
-        mutation InsertUpdateSegment($name: String, $desc: String, $by: String!) {
-            insertUpdateSegment(segmentName: $name, segmentDescription: $desc, updatedBy: $by) {
-                segment { segmentUuid }
-            }
-        }
-        """
+        logger.debug(f"Creating Segment: {segment_data['name']}...")
         variables = {
             "name": segment_data["name"],
             "desc": segment_data["description"],
             "by": UPDATED_BY,
         }
-        result = run_graphql_mutation(engine, mutation, variables)
+        result = run_graphql_mutation(engine, SEGMENT_MUTATION, variables)
         if result:
             api_uuid = result["insertUpdateSegment"]["segment"]["segmentUuid"]
             segment_map[segment_data["local_id"]] = api_uuid
             if first_segment_uuid is None:
                 first_segment_uuid = api_uuid  # Capture the first segment
-                print(
+                logger.debug(
                     f"  -> Success. API UUID: {api_uuid} (FIRST SEGMENT - will be used for price tiers and quote items)"
                 )
             else:
-                print(f"  -> Success. API UUID: {api_uuid}")
+                logger.debug(f"  -> Success. API UUID: {api_uuid}")
             test_data_updates["segment_test_data"].append(
                 {
                     "segmentUuid": api_uuid,
@@ -239,58 +473,66 @@ def generate_and_load_data(engine):
                 }
             )
             test_data_updates["segment_get_test_data"].append({"segmentUuid": api_uuid})
-            test_data_updates["segment_list_test_data"].append(
-                {"limit": 10, "offset": 0}
-            )
+            add_list_test_data("segment_list_test_data", {"limit": 10, "offset": 0})
 
     # 2. Segment Contacts
-    print("\n--- Loading Segment Contacts ---")
+    logger.info("--- Loading Segment Contacts ---")
+    contact_variables = []
     for local_id, api_uuid in segment_map.items():
         for _ in range(NUM_CONTACTS_PER_SEGMENT):
             email = fake.email()
-            print(f"Creating Contact: {email} for Segment {api_uuid}...")
-            mutation = """
-            mutation InsertUpdateSegmentContact($sid: String!, $email: String!, $cid: String, $by: String!) {
-                insertUpdateSegmentContact(segmentUuid: $sid, email: $email, consumerCorpExternalId: $cid, updatedBy: $by) {
-                    segmentContact { contactUuid }
+            logger.debug(f"Creating Contact: {email} for Segment {api_uuid}...")
+            contact_variables.append(
+                {
+                    "sid": api_uuid,
+                    "email": email,
+                    "cid": f"CUST-{random.randint(1000, 9999)}",
+                    "by": UPDATED_BY,
                 }
-            }
-            """
-            variables = {
-                "sid": api_uuid,
-                "email": email,
-                "cid": f"CUST-{random.randint(1000, 9999)}",
-                "by": UPDATED_BY,
-            }
-            result = run_graphql_mutation(engine, mutation, variables)
-            if result:
-                print(f"  -> Success.")
-                contact_uuid = result["insertUpdateSegmentContact"]["segmentContact"][
-                    "contactUuid"
-                ]
-                test_data_updates["segment_contact_test_data"].append(
-                    {
-                        "segmentUuid": api_uuid,
-                        "email": email,
-                        "contactUuid": contact_uuid,
-                        "consumerCorpExternalId": variables["cid"],
-                        "updatedBy": UPDATED_BY,
-                    }
-                )
-                test_data_updates["segment_contact_get_test_data"].append(
-                    {"segmentUuid": api_uuid, "email": email}
-                )
-                test_data_updates["segment_contact_list_test_data"].append(
-                    {"segmentUuid": api_uuid, "limit": 10, "offset": 0}
-                )
+            )
+
+    # Contacts are independent rows; issue them concurrently and record the
+    # results back on this thread in submission order.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(
+            executor.map(
+                lambda variables: run_graphql_mutation(
+                    engine, SEGMENT_CONTACT_MUTATION, variables
+                ),
+                contact_variables,
+            )
+        )
+    for variables, result in zip(contact_variables, results):
+        if result:
+            api_uuid = variables["sid"]
+            email = variables["email"]
+            contact_uuid = result["insertUpdateSegmentContact"]["segmentContact"][
+                "contactUuid"
+            ]
+            test_data_updates["segment_contact_test_data"].append(
+                {
+                    "segmentUuid": api_uuid,
+                    "email": email,
+                    "contactUuid": contact_uuid,
+                    "consumerCorpExternalId": variables["cid"],
+                    "updatedBy": UPDATED_BY,
+                }
+            )
+            test_data_updates["segment_contact_get_test_data"].append(
+                {"segmentUuid": api_uuid, "email": email}
+            )
+            add_list_test_data(
+                "segment_contact_list_test_data",
+                {"segmentUuid": api_uuid, "limit": 10, "offset": 0},
+            )
 
     # 3. Items & Provider Items
-    print("\n--- Loading Items & Provider Items ---")
+    logger.info("--- Loading Items & Provider Items ---")
     local_items = []
-    for _ in range(NUM_ITEMS):
+    for i in range(NUM_ITEMS):
         local_items.append(
             {
-                "local_id": str(uuid.uuid4()),
+                "local_id": f"item_{i}",
                 "name": fake.bs().title(),
                 "description": fake.sentence(),
                 "uom": random.choice(["each", "kg", "case", "pallet"]),
@@ -298,14 +540,7 @@ def generate_and_load_data(engine):
         )
 
     for item_data in local_items:
-        print(f"Creating Item: {item_data['name']}...")
-        mutation = """
-        mutation InsertUpdateItem($type: String, $name: String, $desc: String, $uom: String, $by: String!) {
-            insertUpdateItem(itemType: $type, itemName: $name, itemDescription: $desc, uom: $uom, updatedBy: $by) {
-                item { itemUuid }
-            }
-        }
-        """
+        logger.debug(f"Creating Item: {item_data['name']}...")
         variables = {
             "type": "product",
             "name": item_data["name"],
@@ -313,11 +548,11 @@ def generate_and_load_data(engine):
             "uom": item_data["uom"],
             "by": UPDATED_BY,
         }
-        item_result = run_graphql_mutation(engine, mutation, variables)
+        item_result = run_graphql_mutation(engine, ITEM_MUTATION, variables)
         if item_result:
             item_api_uuid = item_result["insertUpdateItem"]["item"]["itemUuid"]
             item_map[item_data["local_id"]] = item_api_uuid
-            print(f"  -> Item Success. API UUID: {item_api_uuid}")
+            logger.debug(f"  -> Item Success. API UUID: {item_api_uuid}")
             test_data_updates["item_test_data"].append(
                 {
                     "itemUuid": item_api_uuid,
@@ -329,29 +564,24 @@ def generate_and_load_data(engine):
                 }
             )
             test_data_updates["item_get_test_data"].append({"itemUuid": item_api_uuid})
-            test_data_updates["item_list_test_data"].append({"limit": 10, "offset": 0})
+            add_list_test_data("item_list_test_data", {"limit": 10, "offset": 0})
 
-            print(f"  -> Creating corresponding Provider Item...")
-            prov_mutation = """
-            mutation InsertUpdateProviderItem($itemId: String!, $provId: String, $price: Float, $by: String!) {
-                insertUpdateProviderItem(itemUuid: $itemId, providerCorpExternalId: $provId, basePricePerUom: $price, updatedBy: $by) {
-                    providerItem { providerItemUuid }
-                }
-            }
-            """
+            logger.debug(f"  -> Creating corresponding Provider Item...")
             prov_variables = {
                 "itemId": item_api_uuid,
                 "provId": f"PROV-{random.randint(100, 999)}",
                 "price": round(random.uniform(10.0, 500.0), 2),
                 "by": UPDATED_BY,
             }
-            prov_result = run_graphql_mutation(engine, prov_mutation, prov_variables)
+            prov_result = run_graphql_mutation(
+                engine, PROVIDER_ITEM_MUTATION, prov_variables
+            )
             if prov_result:
                 prov_api_uuid = prov_result["insertUpdateProviderItem"]["providerItem"][
                     "providerItemUuid"
                 ]
                 provider_item_map[item_data["local_id"]] = prov_api_uuid
-                print(f"    -> Provider Item Success. API UUID: {prov_api_uuid}")
+                logger.debug(f"    -> Provider Item Success. API UUID: {prov_api_uuid}")
                 test_data_updates["provider_item_test_data"].append(
                     {
                         "providerItemUuid": prov_api_uuid,
@@ -364,79 +594,158 @@ def generate_and_load_data(engine):
                 test_data_updates["provider_item_get_test_data"].append(
                     {"providerItemUuid": prov_api_uuid}
                 )
-                test_data_updates["provider_item_list_test_data"].append(
-                    {"itemUuid": item_api_uuid, "limit": 10, "offset": 0}
+                add_list_test_data(
+                    "provider_item_list_test_data",
+                    {"itemUuid": item_api_uuid, "limit": 10, "offset": 0},
                 )
 
     # 4. Provider Item Batches
-    print(
-        "\n--- Loading Provider Item Batches ---\n"
-    )  # Added newline for better formatting
+    logger.info("--- Loading Provider Item Batches ---")
+    batch_groups = []
     for local_item_id, item_api_uuid in item_map.items():
         if local_item_id in provider_item_map:
             provider_item_api_uuid = provider_item_map[local_item_id]
+            batch_variables = []
             for i in range(NUM_BATCHES_PER_ITEM):
                 batch_no = f"B-{random.randint(10000, 99999)}"
-                print(
+                logger.debug(
                     f"Creating Batch: {batch_no} for Provider Item {provider_item_api_uuid}..."
                 )
-                now = pendulum.now("UTC")
-                produced = (now - timedelta(days=random.randint(10, 100))).isoformat()
-                expires = (now + timedelta(days=random.randint(90, 730))).isoformat()
-                mutation = """
-                mutation InsertUpdateProviderItemBatch($pid: String!, $iid: String!, $bno: String!, $exp: DateTime, $prod: DateTime, $cost: Float, $addCost: Float, $freightCost: Float, $stock: Boolean, $by: String!) {
-                    insertUpdateProviderItemBatch(providerItemUuid: $pid, itemUuid: $iid, batchNo: $bno, expiredAt: $exp, producedAt: $prod, costPerUom: $cost, additionalCostPerUom: $addCost, freightCostPerUom: $freightCost, inStock: $stock, updatedBy: $by) {
-                        providerItemBatch { batchNo }
+                batch_variables.append(
+                    {
+                        "pid": provider_item_api_uuid,
+                        "iid": item_api_uuid,
+                        "bno": batch_no,
+                        "exp": (
+                            now_utc + timedelta(days=random.randint(90, 730))
+                        ).isoformat(),
+                        "prod": (
+                            now_utc - timedelta(days=random.randint(10, 100))
+                        ).isoformat(),
+                        "cost": round(random.uniform(5.0, 450.0), 2),
+                        "addCost": round(random.uniform(0.5, 50.0), 2),
+                        "freightCost": round(random.uniform(0.5, 30.0), 2),
+                        "stock": True,
+                        "by": UPDATED_BY,
                     }
-                }
-                """
-                variables = {
-                    "pid": provider_item_api_uuid,
-                    "iid": item_api_uuid,
-                    "bno": batch_no,
-                    "exp": expires,
-                    "prod": produced,
-                    "cost": round(random.uniform(5.0, 450.0), 2),
-                    "addCost": round(random.uniform(0.5, 50.0), 2),
-                    "freightCost": round(random.uniform(0.5, 30.0), 2),
-                    "stock": True,
-                    "by": UPDATED_BY,
-                }
-                result = run_graphql_mutation(engine, mutation, variables)
-                if result:
-                    print(f"  -> Success.")
-                    test_data_updates["provider_item_batch_test_data"].append(
-                        {
-                            "providerItemUuid": variables["pid"],
-                            "batchNo": batch_no,
-                            "itemUuid": variables["iid"],
-                            "expiredAt": expires,
-                            "producedAt": produced,
-                            "costPerUom": variables["cost"],
-                            "freightCostPerUom": variables["freightCost"],
-                            "additionalCostPerUom": variables["addCost"],
-                            "inStock": True,
-                            "updatedBy": UPDATED_BY,
-                        }
-                    )
-                    test_data_updates["provider_item_batch_get_test_data"].append(
-                        {"providerItemUuid": variables["pid"], "batchNo": batch_no}
-                    )
-                    test_data_updates["provider_item_batch_list_test_data"].append(
-                        {"providerItemUuid": variables["pid"], "limit": 10, "offset": 0}
-                    )
+                )
+            batch_groups.append(batch_variables)
+
+    def insert_batches(batch_variables):
+        return run_graphql_batch(
+            engine,
+            "InsertUpdateProviderItemBatches",
+            PROVIDER_ITEM_BATCH_FIELD,
+            PROVIDER_ITEM_BATCH_VARIABLE_TYPES,
+            batch_variables,
+        )
+
+    # Each provider item's batches are one document; the documents are
+    # independent of each other, so they are sent concurrently.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        group_results = list(executor.map(insert_batches, batch_groups))
+    for batch_variables, results in zip(batch_groups, group_results):
+        for variables, result in zip(batch_variables, results):
+            if result:
+                batch_no = variables["bno"]
+                logger.debug(f"  -> Success. Batch: {batch_no}")
+                test_data_updates["provider_item_batch_test_data"].append(
+                    {
+                        "providerItemUuid": variables["pid"],
+                        "batchNo": batch_no,
+                        "itemUuid": variables["iid"],
+                        "expiredAt": variables["exp"],
+                        "producedAt": variables["prod"],
+                        "costPerUom": variables["cost"],
+                        "freightCostPerUom": variables["freightCost"],
+                        "additionalCostPerUom": variables["addCost"],
+                        "inStock": True,
+                        "updatedBy": UPDATED_BY,
+                    }
+                )
+                test_data_updates["provider_item_batch_get_test_data"].append(
+                    {"providerItemUuid": variables["pid"], "batchNo": batch_no}
+                )
+                add_list_test_data(
+                    "provider_item_batch_list_test_data",
+                    {"providerItemUuid": variables["pid"], "limit": 10, "offset": 0},
+                )
 
     # 5. Item Price Tiers & Discount Prompts
-    print(
-        "\n--- Loading Item Price Tiers & Discount Prompts ---\n"
-    )  # Added newline for better formatting
+    logger.info("--- Loading Item Price Tiers & Discount Prompts ---")
     if not segment_map or not first_segment_uuid:
-        print("No segments created, skipping price tiers and discount prompts.")
+        logger.warning(
+            "No segments created, skipping price tiers and discount prompts."
+        )
         persist_test_data(test_data_updates)
         return
 
     # Use the first_segment_uuid captured in section 1 for all price tiers and quote items
-    print(f"Using first segment UUID {first_segment_uuid} for all price tiers")
+    logger.info(f"Using first segment UUID {first_segment_uuid} for all price tiers")
+
+    def insert_discount_prompts(prompt_configs):
+        for prompt_config in prompt_configs:
+            logger.debug(
+                f"Creating Discount Prompt for scope {prompt_config['scope']} (Tags {prompt_config['tags']})..."
+            )
+        prompt_results = run_graphql_batch(
+            engine,
+            "InsertUpdateDiscountPrompts",
+            DISCOUNT_PROMPT_FIELD,
+            DISCOUNT_PROMPT_VARIABLE_TYPES,
+            [
+                {
+                    "scope": prompt_config["scope"],
+                    "tags": prompt_config["tags"],
+                    "prompt": prompt_config["prompt_text"],
+                    "stat": "active",
+                    "by": UPDATED_BY,
+                }
+                for prompt_config in prompt_configs
+            ],
+        )
+        for prompt_config, prompt_result in zip(prompt_configs, prompt_results):
+            if prompt_result:
+                discount_prompt_uuid = prompt_result["discountPrompt"][
+                    "discountPromptUuid"
+                ]
+                logger.debug(f"  -> Success. Discount Prompt: {discount_prompt_uuid}")
+                test_data_updates["discount_prompt_test_data"].append(
+                    {
+                        "discountPromptUuid": discount_prompt_uuid,
+                        "scope": prompt_config["scope"],
+                        "tags": prompt_config["tags"],
+                        "discountPrompt": prompt_config["prompt_text"],
+                        "status": "active",
+                        "updatedBy": UPDATED_BY,
+                    }
+                )
+                test_data_updates["discount_prompt_get_test_data"].append(
+                    {
+                        "discountPromptUuid": discount_prompt_uuid,
+                    }
+                )
+                add_list_test_data(
+                    "discount_prompt_list_test_data",
+                    {"scope": prompt_config["scope"], "limit": 10, "offset": 0},
+                )
+
+    # Global and segment prompts do not depend on the item, so they are
+    # created once rather than once per item.
+    insert_discount_prompts(
+        [
+            {
+                "scope": "global",
+                "prompt_text": "Apply volume discount for orders over $1000",
+                "tags": [],
+            },
+            {
+                "scope": "segment",
+                "prompt_text": "Special segment pricing available",
+                "tags": [first_segment_uuid],
+            },
+        ]
+    )
 
     for local_item_id, item_api_uuid in item_map.items():
         if local_item_id in provider_item_map:
@@ -463,18 +772,11 @@ def generate_and_load_data(engine):
                     "margin": round(random.uniform(8.0, 10.0), 2),
                 },  # Bulk tier\
             ]
-            for tier_config in tier_configs:
-                print(
-                    f"Creating Price Tier for Item {item_api_uuid} (qty > {tier_config['qty']}) in Segment {segment_api_uuid}..."
-                )
-                tier_mutation = """
-                mutation InsertUpdateItemPriceTier($iid: String!, $pid: String, $sid: String, $qty: Float, $margin: Float, $stat: String, $by: String!) {
-                    insertUpdateItemPriceTier(itemUuid: $iid, providerItemUuid: $pid, segmentUuid: $sid, quantityGreaterThen: $qty, marginPerUom: $margin, status: $stat, updatedBy: $by) {
-                        itemPriceTier { itemPriceTierUuid }
-                    }
-                }
-                """
-                tier_variables = {
+            logger.debug(
+                f"Creating {len(tier_configs)} Price Tiers for Item {item_api_uuid} in Segment {segment_api_uuid}..."
+            )
+            tier_variables = [
+                {
                     "iid": item_api_uuid,
                     "pid": provider_item_api_uuid,
                     "sid": segment_api_uuid,
@@ -483,14 +785,21 @@ def generate_and_load_data(engine):
                     "stat": "active",
                     "by": UPDATED_BY,
                 }
-                tier_result = run_graphql_mutation(
-                    engine, tier_mutation, tier_variables
-                )
+                for tier_config in tier_configs
+            ]
+            tier_results = run_graphql_batch(
+                engine,
+                "InsertUpdateItemPriceTiers",
+                ITEM_PRICE_TIER_FIELD,
+                ITEM_PRICE_TIER_VARIABLE_TYPES,
+                tier_variables,
+            )
+            for tier_config, tier_result in zip(tier_configs, tier_results):
                 if tier_result:
-                    print(f"  -> Success.")
-                    tier_uuid = tier_result["insertUpdateItemPriceTier"][
-                        "itemPriceTier"
-                    ]["itemPriceTierUuid"]
+                    tier_uuid = tier_result["itemPriceTier"]["itemPriceTierUuid"]
+                    logger.debug(
+                        f"  -> Success. Tier (qty > {tier_config['qty']}): {tier_uuid}"
+                    )
                     test_data_updates["item_price_tier_test_data"].append(
                         {
                             "itemUuid": item_api_uuid,
@@ -506,80 +815,30 @@ def generate_and_load_data(engine):
                     test_data_updates["item_price_tier_get_test_data"].append(
                         {"itemUuid": item_api_uuid, "itemPriceTierUuid": tier_uuid}
                     )
-                    test_data_updates["item_price_tier_list_test_data"].append(
-                        {"itemUuid": item_api_uuid, "limit": 10, "offset": 0}
+                    add_list_test_data(
+                        "item_price_tier_list_test_data",
+                        {"itemUuid": item_api_uuid, "limit": 10, "offset": 0},
                     )
 
-            # Create multiple Discount Prompts with different scopes
-            prompt_configs = [
-                {
-                    "scope": "global",
-                    "prompt_text": "Apply volume discount for orders over $1000",
-                    "tags": [],
-                },
-                {
-                    "scope": "segment",
-                    "prompt_text": "Special segment pricing available",
-                    "tags": [segment_api_uuid],
-                },
-                {
-                    "scope": "item",
-                    "prompt_text": f"Bulk discount available for this item",
-                    "tags": [item_api_uuid],
-                },
-                {
-                    "scope": "provider_item",
-                    "prompt_text": f"Provider-specific pricing rules apply",
-                    "tags": [provider_item_api_uuid],
-                },
-            ]
-            for prompt_config in prompt_configs:
-                print(
-                    f"Creating Discount Prompt for scope {prompt_config['scope']} (Item {item_api_uuid})..."
-                )
-                prompt_mutation = """
-                mutation InsertUpdateDiscountPrompt($scope: String!, $tags: [String], $prompt: String!, $stat: String, $by: String!) {
-                    insertUpdateDiscountPrompt(scope: $scope, tags: $tags, discountPrompt: $prompt, status: $stat, updatedBy: $by) {
-                        discountPrompt { discountPromptUuid }
-                    }
-                }
-                """
-                prompt_variables = {
-                    "scope": prompt_config["scope"],
-                    "tags": prompt_config["tags"],
-                    "prompt": prompt_config["prompt_text"],
-                    "stat": "active",
-                    "by": UPDATED_BY,
-                }
-                prompt_result = run_graphql_mutation(
-                    engine, prompt_mutation, prompt_variables
-                )
-                if prompt_result:
-                    print(f"  -> Success.")
-                    discount_prompt_uuid = prompt_result["insertUpdateDiscountPrompt"][
-                        "discountPrompt"
-                    ]["discountPromptUuid"]
-                    test_data_updates["discount_prompt_test_data"].append(
-                        {
-                            "discountPromptUuid": discount_prompt_uuid,
-                            "scope": prompt_config["scope"],
-                            "tags": prompt_config["tags"],
-                            "discountPrompt": prompt_config["prompt_text"],
-                            "status": "active",
-                            "updatedBy": UPDATED_BY,
-                        }
-                    )
-                    test_data_updates["discount_prompt_get_test_data"].append(
-                        {
-                            "discountPromptUuid": discount_prompt_uuid,
-                        }
-                    )
-                    test_data_updates["discount_prompt_list_test_data"].append(
-                        {"scope": prompt_config["scope"], "limit": 10, "offset": 0}
-                    )
+            # Item and provider-item prompts are the only per-item scopes;
+            # both go out in one document.
+            insert_discount_prompts(
+                [
+                    {
+                        "scope": "item",
+                        "prompt_text": f"Bulk discount available for this item",
+                        "tags": [item_api_uuid],
+                    },
+                    {
+                        "scope": "provider_item",
+                        "prompt_text": f"Provider-specific pricing rules apply",
+                        "tags": [provider_item_api_uuid],
+                    },
+                ]
+            )
 
     # 6. Requests
-    print("\n--- Loading Requests ---")
+    logger.info("--- Loading Requests ---")
     request_map = {}
 
     # Get list of segment contacts (emails) to use in requests
@@ -590,6 +849,21 @@ def generate_and_load_data(engine):
 
     # Get list of items to add to requests
     available_items = list(item_map.values())
+    # Reverse index so each selected item resolves its local id in O(1)
+    item_uuid_to_local_id = {v: k for k, v in item_map.items()}
+
+    # Billing/shipping pairs are drawn from a fixed pool so Faker address
+    # generation stays bounded as NUM_REQUESTS grows.
+    address_pool = [
+        {
+            "street": fake.street_address(),
+            "city": fake.city(),
+            "state": fake.state_abbr(),
+            "postal_code": fake.zipcode(),
+            "country": "US",
+        }
+        for _ in range(min(ADDRESS_POOL_SIZE, NUM_REQUESTS * 2))
+    ]
 
     for i in range(NUM_REQUESTS):
         # Pick a random email from segment contacts or generate new one
@@ -601,7 +875,7 @@ def generate_and_load_data(engine):
         request_title = fake.catch_phrase()
         request_description = fake.sentence()
 
-        print(f"Creating Request: {request_title} for {email}...")
+        logger.debug(f"Creating Request: {request_title} for {email}...")
 
         # Select 2-5 random items for this request
         num_items_in_request = random.randint(2, min(5, len(available_items)))
@@ -616,72 +890,24 @@ def generate_and_load_data(engine):
             }
 
             # Optionally add provider_items (50% chance)
-            if random.random() > 0.5 and item_uuid in [
-                k for k, v in item_map.items() if v == item_uuid
-            ]:
-                # Find provider_item_uuid for this item
-                local_item_id = [k for k, v in item_map.items() if v == item_uuid][0]
-                if local_item_id in provider_item_map:
-                    provider_item_uuid = provider_item_map[local_item_id]
-                    item_entry["provider_items"] = [
-                        {
-                            "provider_item_uuid": provider_item_uuid,
-                            "quantity": random.randint(10, 500),
-                        }
-                    ]
+            local_item_id = item_uuid_to_local_id.get(item_uuid)
+            if random.random() > 0.5 and local_item_id in provider_item_map:
+                provider_item_uuid = provider_item_map[local_item_id]
+                item_entry["provider_items"] = [
+                    {
+                        "provider_item_uuid": provider_item_uuid,
+                        "quantity": random.randint(10, 500),
+                    }
+                ]
 
             items.append(item_entry)
 
-        # Create billing and shipping addresses
-        billing_address = {
-            "street": fake.street_address(),
-            "city": fake.city(),
-            "state": fake.state_abbr(),
-            "postal_code": fake.zipcode(),
-            "country": "US",
-        }
-        shipping_address = {
-            "street": fake.street_address(),
-            "city": fake.city(),
-            "state": fake.state_abbr(),
-            "postal_code": fake.zipcode(),
-            "country": "US",
-        }
+        # Pick billing and shipping addresses
+        billing_address, shipping_address = random.sample(address_pool, 2)
 
         # Set expiration date 30-90 days in future
-        expired_at = (
-            pendulum.now("UTC") + timedelta(days=random.randint(30, 90))
-        ).isoformat()
-
-        mutation = """
-        mutation InsertUpdateRequest(
-            $email: String!,
-            $title: String!,
-            $desc: String,
-            $billing: JSONCamelCase,
-            $shipping: JSONCamelCase,
-            $items: [JSONCamelCase],
-            $notes: String,
-            $status: String,
-            $expired: DateTime,
-            $by: String!
-        ) {
-            insertUpdateRequest(
-                email: $email,
-                requestTitle: $title,
-                requestDescription: $desc,
-                billingAddress: $billing,
-                shippingAddress: $shipping,
-                items: $items,
-                notes: $notes,
-                status: $status,
-                expiredAt: $expired,
-                updatedBy: $by
-            ) {
-                request { requestUuid }
-            }
-        }
-        """
+        expired_at = (now_utc + timedelta(days=random.randint(30, 90))).isoformat()
+
         variables = {
             "email": email,
             "title": request_title,
@@ -695,11 +921,11 @@ def generate_and_load_data(engine):
             "by": UPDATED_BY,
         }
 
-        result = run_graphql_mutation(engine, mutation, variables)
+        result = run_graphql_mutation(engine, REQUEST_MUTATION, variables)
         if result:
             request_uuid = result["insertUpdateRequest"]["request"]["requestUuid"]
             request_map[f"request_{i}"] = request_uuid
-            print(f"  -> Success. Request UUID: {request_uuid}")
+            logger.debug(f"  -> Success. Request UUID: {request_uuid}")
             test_data_updates["request_test_data"].append(
                 {
                     "requestUuid": request_uuid,
@@ -718,12 +944,12 @@ def generate_and_load_data(engine):
             test_data_updates["request_get_test_data"].append(
                 {"requestUuid": request_uuid}
             )
-            test_data_updates["request_list_test_data"].append(
-                {"email": email, "limit": 10, "offset": 0}
+            add_list_test_data(
+                "request_list_test_data", {"email": email, "limit": 10, "offset": 0}
             )
 
     # 7. Quotes
-    print("\n--- Loading Quotes ---")
+    logger.info("--- Loading Quotes ---")
     quote_map = {}
 
     for request_local_id, request_uuid in request_map.items():
@@ -731,31 +957,10 @@ def generate_and_load_data(engine):
             provider_corp_external_id = f"PROV-{random.randint(100, 999)}"
             sales_rep_email = fake.email()
 
-            print(
+            logger.debug(
                 f"Creating Quote for Request {request_uuid} (Provider: {provider_corp_external_id})..."
             )
 
-            mutation = """
-            mutation InsertUpdateQuote(
-                $rid: String!,
-                $provId: String,
-                $salesEmail: String,
-                $notes: String,
-                $status: String,
-                $by: String!
-            ) {
-                insertUpdateQuote(
-                    requestUuid: $rid,
-                    providerCorpExternalId: $provId,
-                    salesRepEmail: $salesEmail,
-                    notes: $notes,
-                    status: $status,
-                    updatedBy: $by
-                ) {
-                    quote { quoteUuid }
-                }
-            }
-            """
             variables = {
                 "rid": request_uuid,
                 "provId": provider_corp_external_id,
@@ -765,7 +970,7 @@ def generate_and_load_data(engine):
                 "by": UPDATED_BY,
             }
 
-            result = run_graphql_mutation(engine, mutation, variables)
+            result = run_graphql_mutation(engine, QUOTE_MUTATION, variables)
             if result:
                 quote_uuid = result["insertUpdateQuote"]["quote"]["quoteUuid"]
                 quote_key = f"{request_local_id}_quote_{quote_num}"
@@ -774,7 +979,7 @@ def generate_and_load_data(engine):
                     "quote_uuid": quote_uuid,
                     "provider_corp_external_id": provider_corp_external_id,
                 }
-                print(f"  -> Success. Quote UUID: {quote_uuid}")
+                logger.debug(f"  -> Success. Quote UUID: {quote_uuid}")
                 test_data_updates["quote_test_data"].append(
                     {
                         "requestUuid": request_uuid,
@@ -789,12 +994,13 @@ def generate_and_load_data(engine):
                 test_data_updates["quote_get_test_data"].append(
                     {"requestUuid": request_uuid, "quoteUuid": quote_uuid}
                 )
-                test_data_updates["quote_list_test_data"].append(
-                    {"requestUuid": request_uuid, "limit": 10, "offset": 0}
+                add_list_test_data(
+                    "quote_list_test_data",
+                    {"requestUuid": request_uuid, "limit": 10, "offset": 0},
                 )
 
     # 8. Quote Items
-    print("\n--- Loading Quote Items ---")
+    logger.info("--- Loading Quote Items ---")
     quote_item_map = {}
 
     # Quote items are disabled by default due to DynamoDB eventual consistency issues
@@ -814,7 +1020,7 @@ def generate_and_load_data(engine):
         # time.sleep(90)  # Wait for DynamoDB eventual consistency (60s wasn't enough)
 
         # Use the same first_segment_uuid that was used for price tiers
-        print(f"Using segment UUID for quote items: {first_segment_uuid}")
+        logger.info(f"Using segment UUID for quote items: {first_segment_uuid}")
         quote_item_failed_count = 0
 
         for quote_key, quote_data in quote_map.items():
@@ -828,41 +1034,19 @@ def generate_and_load_data(engine):
 
             for item_idx, item_uuid in enumerate(selected_item_uuids):
                 # Find provider_item_uuid for this item
-                local_item_id = [k for k, v in item_map.items() if v == item_uuid][0]
-                provider_item_uuid = provider_item_map.get(local_item_id)
+                provider_item_uuid = provider_item_map.get(
+                    item_uuid_to_local_id.get(item_uuid)
+                )
 
                 if not provider_item_uuid or not first_segment_uuid:
                     continue
 
                 qty = random.randint(50, 500)
 
-                print(
+                logger.debug(
                     f"Creating Quote Item for Quote {quote_uuid} (Item: {item_uuid}, Provider: {provider_item_uuid}, Qty: {qty}, Segment: {first_segment_uuid})..."
                 )
 
-                mutation = """
-                mutation InsertUpdateQuoteItem(
-                    $qid: String!,
-                    $rid: String,
-                    $iid: String,
-                    $pid: String,
-                    $sid: String,
-                    $qty: Float,
-                    $by: String!
-                ) {
-                    insertUpdateQuoteItem(
-                        quoteUuid: $qid,
-                        requestUuid: $rid,
-                        itemUuid: $iid,
-                        providerItemUuid: $pid,
-                        segmentUuid: $sid,
-                        qty: $qty,
-                        updatedBy: $by
-                    ) {
-                        quoteItem { quoteItemUuid }
-                    }
-                }
-                """
                 variables = {
                     "qid": quote_uuid,
                     "rid": request_uuid,
@@ -873,7 +1057,7 @@ def generate_and_load_data(engine):
                     "by": UPDATED_BY,
                 }
 
-                result = run_graphql_mutation(engine, mutation, variables)
+                result = run_graphql_mutation(engine, QUOTE_ITEM_MUTATION, variables)
                 if (
                     result
                     and result.get("insertUpdateQuoteItem")
@@ -883,7 +1067,7 @@ def generate_and_load_data(engine):
                         "quoteItemUuid"
                     ]
                     quote_item_map[f"{quote_key}_item_{item_idx}"] = quote_item_uuid
-                    print(f"  -> Success. Quote Item UUID: {quote_item_uuid}")
+                    logger.debug(f"  -> Success. Quote Item UUID: {quote_item_uuid}")
                     test_data_updates["quote_item_test_data"].append(
                         {
                             "quoteUuid": quote_uuid,
@@ -899,21 +1083,22 @@ def generate_and_load_data(engine):
                     test_data_updates["quote_item_get_test_data"].append(
                         {"quoteUuid": quote_uuid, "quoteItemUuid": quote_item_uuid}
                     )
-                    test_data_updates["quote_item_list_test_data"].append(
-                        {"quoteUuid": quote_uuid, "limit": 10, "offset": 0}
+                    add_list_test_data(
+                        "quote_item_list_test_data",
+                        {"quoteUuid": quote_uuid, "limit": 10, "offset": 0},
                     )
                 else:
                     quote_item_failed_count += 1
-                    print(f"  -> Failed. Response: {result}")
+                    logger.error(f"  -> Failed. Response: {result}")
                     continue
 
         if quote_item_failed_count > 0:
-            print(
-                f"\nNote: {quote_item_failed_count} quote items were skipped due to DynamoDB eventual consistency"
+            logger.warning(
+                f"Note: {quote_item_failed_count} quote items were skipped due to DynamoDB eventual consistency"
             )
 
     # 9. Installments
-    print("\n--- Loading Installments ---")
+    logger.info("--- Loading Installments ---")
 
     for quote_key, quote_data in quote_map.items():
         request_uuid = quote_data["request_uuid"]
@@ -921,38 +1106,11 @@ def generate_and_load_data(engine):
 
         for inst_idx in range(NUM_INSTALLMENTS_PER_QUOTE):
             priority = inst_idx + 1
-            scheduled_date = (
-                pendulum.now("UTC") + timedelta(days=30 * (inst_idx + 1))
-            ).isoformat()
+            scheduled_date = (now_utc + timedelta(days=30 * (inst_idx + 1))).isoformat()
             installment_amount = round(random.uniform(500.0, 5000.0), 2)
 
-            print(f"Creating Installment {priority} for Quote {quote_uuid}...")
-
-            mutation = """
-            mutation InsertUpdateInstallment(
-                $qid: String!,
-                $rid: String,
-                $priority: Int,
-                $scheduled: DateTime,
-                $amount: SafeFloat,
-                $payment: String,
-                $status: String,
-                $by: String!
-            ) {
-                insertUpdateInstallment(
-                    quoteUuid: $qid,
-                    requestUuid: $rid,
-                    priority: $priority,
-                    scheduledDate: $scheduled,
-                    installmentAmount: $amount,
-                    paymentMethod: $payment,
-                    status: $status,
-                    updatedBy: $by
-                ) {
-                    installment { installmentUuid }
-                }
-            }
-            """
+            logger.debug(f"Creating Installment {priority} for Quote {quote_uuid}...")
+
             variables = {
                 "qid": quote_uuid,
                 "rid": request_uuid,
@@ -966,12 +1124,12 @@ def generate_and_load_data(engine):
                 "by": UPDATED_BY,
             }
 
-            result = run_graphql_mutation(engine, mutation, variables)
+            result = run_graphql_mutation(engine, INSTALLMENT_MUTATION, variables)
             if result:
                 installment_uuid = result["insertUpdateInstallment"]["installment"][
                     "installmentUuid"
                 ]
-                print(f"  -> Success. Installment UUID: {installment_uuid}")
+                logger.debug(f"  -> Success. Installment UUID: {installment_uuid}")
                 test_data_updates["installment_test_data"].append(
                     {
                         "quoteUuid": quote_uuid,
@@ -988,8 +1146,9 @@ def generate_and_load_data(engine):
                 test_data_updates["installment_get_test_data"].append(
                     {"quoteUuid": quote_uuid, "installmentUuid": installment_uuid}
                 )
-                test_data_updates["installment_list_test_data"].append(
-                    {"quoteUuid": quote_uuid, "limit": 10, "offset": 0}
+                add_list_test_data(
+                    "installment_list_test_data",
+                    {"quoteUuid": quote_uuid, "limit": 10, "offset": 0},
                 )
 
     # Persist generated data for tests
@@ -999,4 +1158,4 @@ def generate_and_load_data(engine):
 if __name__ == "__main__":
     engine_instance = create_engine()
     generate_and_load_data(engine_instance)
-    print("\n--- Data Loading Complete ---")
+    logger.info("--- Data Loading Complete ---")
@@ -30,6 +30,7 @@ import json
 import logging
 import os
 import sys
+from unittest.mock import patch
 
 import pytest
 from test_helpers import call_method, log_test_result
@@ -980,6 +981,112 @@ def test_graphql_insert_update_quote_item_py(ai_rfq_engine, schema, test_data):
     assert result is not None
 
 
+@pytest.mark.integration
+@pytest.mark.parametrize("test_data", QUOTE_ITEM_TEST_DATA)
+@log_test_result
+def test_graphql_batch_insert_quote_items_py(ai_rfq_engine, schema, test_data):
+    """Test batch quote item insert against the single-item insert path."""
+    from ai_rfq_engine.models import quote as quote_module
+
+    item = {
+        "itemUuid": test_data["itemUuid"],
+        "providerItemUuid": test_data["providerItemUuid"],
+        "segmentUuid": test_data["segmentUuid"],
+        "qty": test_data["qty"],
+    }
+    batch_query = Graphql.generate_graphql_operation(
+        "batchInsertQuoteItems", "Mutation", schema
+    )
+    batch_variables = {
+        "quoteUuid": test_data["quoteUuid"],
+        "requestUuid": test_data["requestUuid"],
+        "items": [item, item, item],
+        "updatedBy": test_data["updatedBy"],
+    }
+    created_uuids = []
+
+    try:
+        # Single-item insert as the pricing reference
+        single_query = Graphql.generate_graphql_operation(
+            "insertUpdateQuoteItem", "Mutation", schema
+        )
+        single_variables = {
+            key: value for key, value in test_data.items() if key != "quoteItemUuid"
+        }
+        result, error = call_method(
+            ai_rfq_engine,
+            "ai_rfq_graphql",
+            {"query": single_query, "variables": single_variables},
+            "insert_quote_item",
+        )
+        assert error is None
+        single = result["data"]["insertUpdateQuoteItem"]["quoteItem"]
+        created_uuids.append(single["quoteItemUuid"])
+
+        # N items in one call; quote totals are recalculated exactly once
+        with patch.object(
+            quote_module,
+            "update_quote_totals",
+            wraps=quote_module.update_quote_totals,
+        ) as mock_update_totals:
+            result, error = call_method(
+                ai_rfq_engine,
+                "ai_rfq_graphql",
+                {"query": batch_query, "variables": batch_variables},
+                "batch_insert_quote_items",
+            )
+        assert error is None
+        assert not result.get("errors"), result.get("errors")
+        quote_items = result["data"]["batchInsertQuoteItems"]["quoteItems"]
+        created_uuids.extend(quote_item["quoteItemUuid"] for quote_item in quote_items)
+
+        assert len(quote_items) == len(batch_variables["items"])
+        assert len({quote_item["quoteItemUuid"] for quote_item in quote_items}) == len(
+            quote_items
+        )
+        for quote_item in quote_items:
+            assert quote_item["pricePerUom"] == single["pricePerUom"]
+            assert quote_item["subtotal"] == single["subtotal"]
+            assert quote_item["finalSubtotal"] == single["finalSubtotal"]
+        assert mock_update_totals.call_count == 1
+
+        # One invalid item rejects the whole batch before anything is written
+        with patch(
+            "ai_rfq_engine.models.quote_item.QuoteItemModel.batch_write"
+        ) as mock_batch_write:
+            result, error = call_method(
+                ai_rfq_engine,
+                "ai_rfq_graphql",
+                {
+                    "query": batch_query,
+                    "variables": {
+                        **batch_variables,
+                        "items": [item, {**item, "qty": 0}],
+                    },
+                },
+                "batch_insert_quote_items_invalid",
+            )
+        assert error is not None or result.get("errors")
+        mock_batch_write.assert_not_called()
+    finally:
+        delete_query = Graphql.generate_graphql_operation(
+            "deleteQuoteItem", "Mutation", schema
+        )
+        for quote_item_uuid in created_uuids:
+            call_method(
+                ai_rfq_engine,
+                "ai_rfq_graphql",
+                {
+                    "query": delete_query,
+                    "variables": {
+                        "quoteUuid": test_data["quoteUuid"],
+                        "quoteItemUuid": quote_item_uuid,
+                    },
+                },
+                "delete_quote_item",
+            )
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize("test_data", QUOTE_ITEM_GET_TEST_DATA)
 @log_test_result